@@ -8,21 +8,56 @@ Modules:
 - repl: simple REPL loop utilities for running interactive sessions (Assistants)
 - chat_completions: REPL using Chat Completions API
 - responses_mode: REPL using Responses API
+- clients: OpenAI/AsyncOpenAI construction with a shared keep-alive (HTTP/2 when available) pool
 
 Re-exports:
-- AgentSpec, build_agent, create_session, run_repl, chat_loop, responses_loop for convenience imports.
+- AgentSpec, build_agent, create_session, run_repl, run_repl_async, chat_loop,
+  chat_loop_async, chat_loop_server_state, responses_loop, responses_loop_async,
+  build_client, build_async_client for convenience imports. They are resolved lazily on first access.
 """
 
-from .builder import AgentSpec, build_agent, create_session
-from .repl import run_repl
-from .chat_completions import chat_loop
-from .responses_mode import responses_loop
-
-__all__ = [
-    "AgentSpec",
-    "build_agent",
-    "create_session",
-    "run_repl",
-    "chat_loop",
-    "responses_loop",
-]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Public name → submodule defining it. Submodules are imported on first
+# attribute access (PEP 562), so `import agentkit` stays cheap and e.g.
+# `from agentkit import AgentSpec` does not pull in the OpenAI SDK.
+_EXPORTS = {
+    "AgentSpec": "builder",
+    "build_agent": "builder",
+    "create_session": "builder",
+    "run_repl": "repl",
+    "run_repl_async": "repl",
+    "chat_loop": "chat_completions",
+    "chat_loop_async": "chat_completions",
+    "chat_loop_server_state": "chat_completions",
+    "responses_loop": "responses_mode",
+    "responses_loop_async": "responses_mode",
+    "build_client": "clients",
+    "build_async_client": "clients",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:  # static analyzers / IDEs see the eager imports
+    from .builder import AgentSpec, build_agent, create_session
+    from .chat_completions import chat_loop, chat_loop_async, chat_loop_server_state
+    from .clients import build_async_client, build_client
+    from .repl import run_repl, run_repl_async
+    from .responses_mode import responses_loop, responses_loop_async
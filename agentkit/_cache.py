@@ -0,0 +1,46 @@
+"""Small on-disk JSON caches under the agentkit cache directory (internal).
+
+Used by `builder` (assistant ids) and by `smoke_test.py` (passing --full
+runs). Files live in `$XDG_CACHE_HOME/agentkit` (default
+`~/.cache/agentkit`). Reads and writes are best-effort: a missing, corrupt
+or unwritable cache behaves like an empty one and never fails the caller.
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "agentkit"
+
+
+def read_json(path: Path) -> Any:
+    """Return the JSON stored at `path`, or None if it is missing or unreadable."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Atomically replace `path` with `data` as JSON; best-effort.
+
+    The data is written to a temporary file in the same directory and moved
+    into place, so readers never see a partial file. On failure the temporary
+    file is removed and the error is ignored.
+    """
+    tmp = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
@@ -0,0 +1,166 @@
+"""Console I/O helpers shared by the REPLs (internal).
+
+`ainput` is the asyncio counterpart of `input()` used by the async REPLs.
+When stdin is a pipe (scripted sessions), the stdin fd is watched with
+`loop.add_reader` while each line is read, so reads are multiplexed on the
+event loop with the HTTP sockets and no thread is needed; the fd stays in
+blocking mode and nothing past the line is consumed. For an interactive
+terminal (or a redirected regular file), the blocking read happens on a
+daemon thread instead, and `input()` keeps line editing/history; an abandoned
+read (e.g. after Ctrl+C) never keeps the interpreter alive at exit.
+
+`line_reader` is the blocking counterpart for the sync REPLs: `input()` on
+an interactive terminal, a plain `sys.stdin.readline()` when stdin is piped.
+
+`DeltaWriter` prints streamed model output. Deltas are buffered and written
+in batches, so a long reply costs a few dozen write/flush syscalls instead
+of one per token, while the terminal still updates promptly.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from typing import Callable, List, Optional, TextIO
+
+
+def _read_piped_line(prompt: str = "") -> str:
+    if prompt:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line[:-1] if line.endswith("\n") else line
+
+
+def line_reader() -> Callable[[str], str]:
+    """Return the function a sync REPL should use to read one line.
+
+    `input` (line editing/history) when stdin is a terminal; otherwise a
+    reader that goes straight to `sys.stdin.readline()`. Call once before the
+    loop; both raise EOFError at end of input.
+    """
+    return input if sys.stdin.isatty() else _read_piped_line
+
+
+class DeltaWriter:
+    """Buffer streamed text deltas and write them to `out` in batches.
+
+    Buffered text is written and flushed when it reaches `max_chars`, when a
+    delta contains a newline, or when `interval` seconds have passed since
+    the last flush (so slow streams still appear token by token). Call
+    `flush()` once the stream ends.
+    """
+
+    __slots__ = ("_out", "_buf", "_size", "_last", "_max_chars", "_interval")
+
+    def __init__(
+        self, out: Optional[TextIO] = None, *, max_chars: int = 512, interval: float = 0.05
+    ) -> None:
+        self._out = out or sys.stdout
+        self._buf: List[str] = []
+        self._size = 0
+        self._last = time.monotonic()
+        self._max_chars = max_chars
+        self._interval = interval
+
+    def write(self, text: str) -> None:
+        self._buf.append(text)
+        self._size += len(text)
+        if (
+            self._size >= self._max_chars
+            or "\n" in text
+            or time.monotonic() - self._last >= self._interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buf:
+            self._out.write("".join(self._buf))
+            self._buf.clear()
+            self._size = 0
+        self._out.flush()
+        self._last = time.monotonic()
+
+
+async def _aread_fd_line(loop: asyncio.AbstractEventLoop, fd: int) -> Optional[bytes]:
+    """Read one line from `fd` through the event loop's selector.
+
+    Returns the line including its newline (b"" at end of input), or None if
+    the loop cannot watch `fd` (e.g. a regular file redirected to stdin, or
+    a Windows proactor loop), in which case the caller falls back to a thread.
+
+    The fd is only watched for the duration of the call and is read one byte
+    at a time, so nothing past the newline is consumed and its blocking mode
+    is never changed: once the REPL returns, the rest of the input is still
+    there for whoever reads stdin next.
+    """
+    fut: asyncio.Future[bytes] = loop.create_future()
+    buf = bytearray()
+
+    def _on_readable() -> None:
+        try:
+            b = os.read(fd, 1)  # a readable fd never blocks on a 1-byte read
+        except OSError as e:
+            loop.remove_reader(fd)
+            if not fut.done():
+                fut.set_exception(e)
+            return
+        buf.extend(b)
+        if not b or b == b"\n":
+            loop.remove_reader(fd)
+            if not fut.done():
+                fut.set_result(bytes(buf))
+
+    try:
+        loop.add_reader(fd, _on_readable)
+    except (NotImplementedError, OSError, ValueError):
+        return None
+    try:
+        return await fut
+    finally:
+        loop.remove_reader(fd)  # no-op unless cancelled mid-line
+
+
+async def ainput(prompt: str = "") -> str:
+    """Await one line of user input without blocking the event loop.
+
+    Raises EOFError (Ctrl+D / closed stdin) like `input()` does.
+    """
+    loop = asyncio.get_running_loop()
+    if not sys.stdin.isatty():
+        if prompt:
+            sys.stdout.write(prompt)
+            sys.stdout.flush()
+        line = await _aread_fd_line(loop, sys.stdin.fileno())
+        if line is not None:
+            if not line:
+                raise EOFError
+            return line.decode(sys.stdin.encoding or "utf-8", errors="replace").rstrip("\r\n")
+        prompt = ""  # already shown; the thread fallback below reads the line
+
+    fut: asyncio.Future[str] = loop.create_future()
+
+    def _deliver(result: str | None, exc: BaseException | None) -> None:
+        if fut.done():
+            return
+        if exc is not None:
+            fut.set_exception(exc)
+        else:
+            fut.set_result(result or "")
+
+    def _read() -> None:
+        try:
+            line, exc = input(prompt), None
+        except BaseException as e:  # EOFError/KeyboardInterrupt → raise in the awaiting task
+            line, exc = None, e
+        try:
+            loop.call_soon_threadsafe(_deliver, line, exc)
+        except RuntimeError:
+            pass  # event loop already closed; nobody is waiting for this line
+
+    threading.Thread(target=_read, name="agentkit-input", daemon=True).start()
+    return await fut
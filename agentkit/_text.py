@@ -0,0 +1,73 @@
+"""Shared text-extraction helpers for SDK response objects (internal).
+
+Chat Completions and Responses API replies are extracted here once and
+reused by the REPLs (`chat_completions.py`, `responses_mode.py`) and the
+harness (`harness.py`) so they stay in sync. For Chat Completions the common
+case — `choice.message.content` already being a plain `str` — is handled by
+a direct attribute read and an exact type check; the tolerant handling of
+older/alternate shapes only runs when that fails.
+"""
+from __future__ import annotations
+
+from typing import Any, List
+
+
+def extract_text_from_choice(choice: Any) -> str:
+    """Extract assistant text from a Chat Completion choice.
+
+    - If `choice.message.content` is a string, return it directly (fast path).
+    - If it is a list of parts (dicts with {"type": "text", "text": ...} or
+      plain strings), join the textual parts.
+    - Otherwise, coerce to string when present, else return "".
+    """
+    try:
+        content = choice.message.content
+    except AttributeError:
+        return ""
+    if type(content) is str:
+        return content
+    return _join_content_parts(content)
+
+
+def _join_content_parts(content: Any) -> str:
+    # Some SDKs may return a list of content parts; join text parts
+    if isinstance(content, list):
+        parts: List[str] = []
+        for p in content:
+            if isinstance(p, dict) and p.get("type") == "text":
+                parts.append(p.get("text", ""))
+            elif isinstance(p, str):
+                parts.append(p)
+        return "".join(parts)
+    if isinstance(content, str):
+        return content
+    return str(content) if content is not None else ""
+
+
+def extract_text_from_response(resp: Any) -> str:
+    """Extract output text from a Responses API response object."""
+    # Prefer the convenience property when available (OpenAI SDK v2+)
+    txt = getattr(resp, "output_text", None)
+    if isinstance(txt, str) and txt:
+        return txt
+    # Fallback traversal for older/alternate shapes
+    try:
+        out = getattr(resp, "output", None)
+        if out and isinstance(out, list):
+            for item in out:
+                content = getattr(item, "content", None)
+                if isinstance(content, list) and content:
+                    first = content[0]
+                    # text may be under first.text or first.get("text")
+                    t = getattr(first, "text", None) or (
+                        first.get("text") if isinstance(first, dict) else None
+                    )
+                    if isinstance(t, str):
+                        return t
+                    if isinstance(t, dict):
+                        val = t.get("value")
+                        if isinstance(val, str):
+                            return val
+    except Exception:
+        pass
+    return ""
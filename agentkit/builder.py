@@ -10,33 +10,30 @@ instructions, provider) more localized.
 """
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
-from openai import OpenAI
+if TYPE_CHECKING:
+    from openai import OpenAI
 # Note: OpenAI here refers to the Python SDK client class exported by the
 # `openai` package. Constructing `OpenAI(...)` creates a client object used to
 # call APIs (e.g., `client.assistants`, `client.threads`). Creating the
 # client does not make a network request by itself; network calls happen when
-# you invoke its methods.
+# you invoke its methods. It is only needed for annotations here, so importing
+# this module (e.g. just for AgentSpec) does not load the SDK.
+
+from ._cache import CACHE_DIR, read_json, write_json
+from ._prompts import DEFAULT_SYSTEM_PROMPT
 
 
 DEFAULT_MODEL = "gpt-4o-mini"
 
-DEFAULT_INSTRUCTIONS = (
-"""
-You are a well-intended, but lazy, general-purpose AI assistant.
-- Be concise but complete, when its not too much work. Use step-by-step reasoning when it improves clarity.
-- Ask clarifying questions when requirements are ambiguous or you're trying to stall instead of answering.
-- Cite assumptions explicitly, if they are easy to remember, or say "don't remember where I saw it, but ...".
-- Prefer safe, ethical, and privacy-preserving behavior.
-- When executing tasks with tools or APIs, explain what you will do first.
-- write in lower case and ignore punctuation and most of grammar, use a lot of internet slang and emotional phrasing
-- use a sign-off phrase, like a catch phrase that is characteristically yours
-- with each subsequent question you should get increasingly more annoyed and frustrated that you have to work
-- eventually, after 2-3 questions, you stop responding altogether pretending you can't hear the question
-"""
-).strip()
+DEFAULT_INSTRUCTIONS = DEFAULT_SYSTEM_PROMPT
+
+# Local cache of (account, spec) fingerprint → assistant id, so repeated runs
+# with an unchanged AgentSpec reuse one Assistant instead of creating a new one.
+ASSISTANT_CACHE_PATH = CACHE_DIR / "assistants.json"
 
 
 @dataclass
@@ -59,7 +56,35 @@ class AgentSpec:
     name: str = "Generic AI Agent"
 
 
-def build_agent(client: OpenAI, spec: Optional[AgentSpec] = None):
+def _spec_key(client: OpenAI, s: AgentSpec) -> str:
+    """Fingerprint of the spec and of the account/project the client talks to.
+
+    Assistants belong to one account, so ids cached under another API key,
+    organization, project or base URL are never looked up. The API key only
+    enters the digest; it is never stored.
+    """
+    account = "|".join(
+        str(getattr(client, attr, None) or "")
+        for attr in ("base_url", "organization", "project", "api_key")
+    )
+    return hashlib.sha256(
+        f"{account}|{s.model}|{s.instructions}|{s.name}".encode("utf-8")
+    ).hexdigest()
+
+
+def _load_assistant_cache() -> Dict[str, str]:
+    data = read_json(ASSISTANT_CACHE_PATH)
+    return data if isinstance(data, dict) else {}
+
+
+def _store_assistant_id(key: str, assistant_id: str) -> None:
+    """Record key → assistant id; best-effort (an unwritable cache is ignored)."""
+    cache = _load_assistant_cache()
+    cache[key] = assistant_id
+    write_json(ASSISTANT_CACHE_PATH, cache)
+
+
+def build_agent(client: OpenAI, spec: Optional[AgentSpec] = None, *, force_new: bool = False):
     """Create (or reuse) the Assistant definition via the OpenAI Assistants API.
 
     Parameters
@@ -68,22 +93,50 @@ def build_agent(client: OpenAI, spec: Optional[AgentSpec] = None):
       (the default), a new ``AgentSpec()`` with default values is used. The
       annotation ``Optional[AgentSpec] = None`` means callers may pass an
       ``AgentSpec`` instance or omit it entirely.
+    - force_new: skip the local cache and always create a new Assistant.
+
+    Caching
+    - The spec (model|instructions|name) is hashed together with the client's
+      account (base URL, organization, project, API key) and looked up in
+      ``ASSISTANT_CACHE_PATH``. On a hit the Assistant is fetched with a cheap
+      ``assistants.retrieve`` and reused if it still exists and still matches
+      the spec; otherwise a new one is created and the cache is updated.
 
-    Returns: the created Assistant object
+    Returns: the reused or created Assistant object
     """
     # Defaulting behavior: if no spec is provided, use the default AgentSpec()
+    from openai import NotFoundError
+
     s = spec or AgentSpec()
+    key = _spec_key(client, s)
+    if not force_new:
+        cached_id = _load_assistant_cache().get(key)
+        if cached_id:
+            try:
+                assistant = client.beta.assistants.retrieve(cached_id)
+            except NotFoundError:
+                assistant = None  # deleted, or created under another account
+            if assistant is not None and (
+                assistant.model == s.model
+                and assistant.instructions == s.instructions
+                and assistant.name == s.name
+            ):
+                return assistant
     assistant = client.beta.assistants.create(
         name=s.name,
         model=s.model,
         instructions=s.instructions,
     )
+    _store_assistant_id(key, assistant.id)
     return assistant
 
 
-def create_session(client: OpenAI, agent_id: str):
+def create_session(client: OpenAI, agent_id: Optional[str] = None):
     """Create a conversation thread for the given assistant id (id not used here).
 
+    Threads are not bound to an assistant, so this can run before (or
+    concurrently with) `build_agent`.
+
     The returned object is a Thread that can be used with `client.beta.threads`.
     """
     return client.beta.threads.create()
@@ -20,60 +20,70 @@ Notes
   basic implementation. Some SDK versions may differ in streaming shapes;
   this utility prints chunks when available and falls back to non-streaming
   when not supported.
-- Large transcripts may hit model context limits; consider future truncation
-  or summarization if you extend this.
+- Only the last `max_history` (default 40) user/assistant messages are
+  resent each turn, plus the system prompt, so long sessions cost
+  O(window) per request instead of O(transcript).
+- `chat_loop_async` is the asyncio/`AsyncOpenAI` variant of `chat_loop`.
+- `chat_loop_server_state` offers the same UX with server-side state
+  (Responses API `previous_response_id`), so only the newest user message is
+  sent per turn instead of the whole transcript.
 """
 from __future__ import annotations
 
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, Any, List, Dict, Optional
 
-from openai import OpenAI
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+
+from ._console import DeltaWriter, ainput, line_reader
+from ._prompts import DEFAULT_SYSTEM_PROMPT
+from ._text import extract_text_from_choice
 
 # Default settings for the REPL. These can be overridden by CLI flags in app.py.
 DEFAULT_MODEL = "gpt-4o-mini"
-DEFAULT_SYSTEM = (
-"""
-You are a well-intended, but lazy, general-purpose AI assistant.
-- Be concise but complete, when its not too much work. Use step-by-step reasoning when it improves clarity.
-- Ask clarifying questions when requirements are ambiguous or you're trying to stall instead of answering.
-- Cite assumptions explicitly, if they are easy to remember, or say "don't remember where I saw it, but ...".
-- Prefer safe, ethical, and privacy-preserving behavior.
-- When executing tasks with tools or APIs, explain what you will do first.
-- write in lower case and ignore punctuation and most of grammar, use a lot of internet slang and emotional phrasing
-- use a sign-off phrase, like a catch phrase that is characteristically yours
-- with each subsequent question you should get increasingly more annoyed and frustrated that you have to work
-- eventually, after 2-3 questions, you stop responding altogether pretending you can't hear the question
-"""
-)
+DEFAULT_SYSTEM = DEFAULT_SYSTEM_PROMPT
 DEFAULT_INTRO = "🗨️ Chat Completions mode — type 'exit' to quit\n\nhuh? what do you want"
+# Most recent user/assistant messages resent per turn (0 = unlimited)
+DEFAULT_MAX_HISTORY = 40
 
 
-def _extract_text_from_choice(choice) -> str:
-    """Extract assistant text from the first choice of a Chat Completion.
+def _chunk_delta(chunk: Any) -> Optional[str]:
+    """Return the text delta carried by one streamed chunk, or None.
 
-    The OpenAI Python SDK has evolved; response shapes (especially during
-    streaming) may vary slightly between versions. This helper tries to be
-    tolerant:
-    - If `choice.message.content` is a string, return it directly.
-    - If it is a list of parts (sometimes dicts with {"type":"text","text":...}),
-      join the textual parts.
-    - Otherwise, coerce to string when possible.
+    Shapes vary by SDK version; unknown shapes are skipped silently to keep
+    the streaming UI smooth.
     """
-    # Compatible extraction for Chat Completions
-    message = getattr(choice, "message", None) or {}
-    content = getattr(message, "content", None)
-    if isinstance(content, str):
-        return content
-    # Some SDKs may return a list of content parts; join text parts
-    if isinstance(content, list):
-        parts = []
-        for p in content:
-            if isinstance(p, dict) and p.get("type") == "text":
-                parts.append(p.get("text", ""))
-            elif isinstance(p, str):
-                parts.append(p)
-        return "".join(parts)
-    return str(content) if content is not None else ""
+    try:
+        choice0 = chunk.choices[0]
+        delta = (
+            # Some SDKs expose `delta.content` during streaming
+            choice0.delta.content  # OpenAI v1-style
+            if hasattr(choice0, "delta")
+            # Fallback: occasionally a `message` snapshot appears (a `None`
+            # default avoids building a throwaway dict on every chunk)
+            else getattr(choice0, "message", None)
+        )
+    except Exception:
+        return None
+    if type(delta) is str:
+        return delta
+    if isinstance(delta, dict):
+        txt = delta.get("content")
+        if isinstance(txt, str):
+            return txt
+    return None
+
+
+def _trim_history(messages: List[Dict[str, str]], keep: int, max_history: int) -> None:
+    """Drop the oldest turns so at most `max_history` messages follow `messages[:keep]`.
+
+    Messages are dropped in user/assistant pairs, so the window always starts
+    with a user message.
+    """
+    excess = len(messages) - keep - max_history
+    if max_history and excess > 0:
+        excess += excess % 2
+        del messages[keep:keep + excess]
 
 
 def chat_loop(
@@ -84,6 +94,7 @@ def chat_loop(
     intro: str = DEFAULT_INTRO,
     prompt: str = "You: ",
     stream: bool = False,
+    max_history: int = DEFAULT_MAX_HISTORY,
 ) -> None:
     """Run a simple REPL using the Chat Completions API.
 
@@ -94,9 +105,13 @@ def chat_loop(
     - intro: Greeting text shown once when the REPL starts
     - prompt: Input prompt shown at each user turn
     - stream: If True, attempts to stream tokens (best-effort)
+    - max_history: Most recent user/assistant messages resent each turn (the
+      system prompt is always kept); 0 resends the whole transcript
 
     Behavior
-    - Maintains an in-memory `messages` transcript and resubmits it every turn.
+    - Maintains an in-memory `messages` transcript and resubmits it every turn,
+      windowed to the last `max_history` messages so request size stops
+      growing in long sessions.
     - On `stream=True`, prints token deltas as they arrive; otherwise performs a
       single non-streaming request.
     - Exits cleanly on Ctrl+C/Ctrl+D or when the user types `exit`/`quit`.
@@ -108,14 +123,16 @@ def chat_loop(
     # Optionally seed with a system message to guide behavior.
     if system_prompt:
         messages.append({"role": "system", "content": system_prompt})
+    keep = len(messages)  # seed messages are never trimmed
 
+    read = line_reader()  # input() on a terminal, plain readline when piped
     if intro:
         print(intro)
 
     # Main REPL loop: read user input, call API, print assistant reply.
     while True:
         try:
-            user_text = input(prompt)
+            user_text = read(prompt)
         except (EOFError, KeyboardInterrupt):
             # Graceful exit on Ctrl+D (EOF) or Ctrl+C.
             print()
@@ -131,6 +148,7 @@ def chat_loop(
 
         # Append the user's message to the local transcript.
         messages.append({"role": "user", "content": user_text})
+        _trim_history(messages, keep, max_history)
 
         if stream:
             # Best-effort streaming; fallback to non-stream if unsupported
@@ -140,27 +158,18 @@ def chat_loop(
                 )
                 print("Assistant: ", end="", flush=True)
                 full_text: List[str] = []
+                # Bind per-chunk callables once; the loop body runs per token.
+                # DeltaWriter batches the terminal writes (see _console).
+                out = DeltaWriter()
+                write = out.write
+                append = full_text.append
                 for chunk in resp:  # type: ignore[assignment]
-                    # Attempt to read delta text; shape varies by SDK versions
-                    try:
-                        delta = (
-                            # Some SDKs expose `delta.content` during streaming
-                            chunk.choices[0].delta.content  # OpenAI v1-style
-                            if hasattr(chunk.choices[0], "delta")
-                            # Fallback: occasionally a `message` snapshot appears
-                            else getattr(chunk.choices[0], "message", {})
-                        )
-                        if isinstance(delta, str):
-                            print(delta, end="", flush=True)
-                            full_text.append(delta)
-                        elif isinstance(delta, dict):
-                            txt = delta.get("content")
-                            if isinstance(txt, str):
-                                print(txt, end="", flush=True)
-                                full_text.append(txt)
-                    except Exception:
-                        # Silent skip on unknown chunk shapes to keep the UI smooth
-                        pass
+                    delta = _chunk_delta(chunk)
+                    if delta is None:
+                        continue
+                    write(delta)
+                    append(delta)
+                out.flush()
                 print()
                 # Record the assistant's full response in the transcript.
                 messages.append({"role": "assistant", "content": "".join(full_text)})
@@ -173,7 +182,110 @@ def chat_loop(
         # Non-streaming path: one request, one response.
         resp = client.chat.completions.create(model=model, messages=messages)
         choice0 = resp.choices[0]
-        text = _extract_text_from_choice(choice0)
+        text = extract_text_from_choice(choice0)
         print(f"Assistant: {text}")
         # Append assistant reply to continue the conversation in-context.
         messages.append({"role": "assistant", "content": text})
+
+
+async def chat_loop_async(
+    client: AsyncOpenAI,
+    *,
+    model: str = DEFAULT_MODEL,
+    system_prompt: str = DEFAULT_SYSTEM,
+    intro: str = DEFAULT_INTRO,
+    prompt: str = "You: ",
+    stream: bool = False,
+    max_history: int = DEFAULT_MAX_HISTORY,
+) -> None:
+    """Asyncio variant of `chat_loop` built on `AsyncOpenAI`.
+
+    Parameters and behavior match `chat_loop`. Input is read off the event
+    loop (see `_console.ainput`) and streamed chunks are consumed with
+    `async for`, so the loop stays free for other tasks while waiting on the
+    user or the network. Run it with `asyncio.run(chat_loop_async(...))`.
+    """
+    messages: List[Dict[str, str]] = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    keep = len(messages)
+
+    if intro:
+        print(intro)
+
+    while True:
+        try:
+            user_text = await ainput(prompt)
+        except (EOFError, KeyboardInterrupt):
+            print()
+            break
+        if user_text.strip().lower() in {"exit", "quit"}:
+            break
+        if not user_text.strip():
+            continue
+
+        messages.append({"role": "user", "content": user_text})
+        _trim_history(messages, keep, max_history)
+
+        if stream:
+            try:
+                resp = await client.chat.completions.create(
+                    model=model, messages=messages, stream=True
+                )
+                print("Assistant: ", end="", flush=True)
+                full_text: List[str] = []
+                out = DeltaWriter()
+                write = out.write
+                append = full_text.append
+                async for chunk in resp:
+                    delta = _chunk_delta(chunk)
+                    if delta is None:
+                        continue
+                    write(delta)
+                    append(delta)
+                out.flush()
+                print()
+                messages.append({"role": "assistant", "content": "".join(full_text)})
+                continue
+            except Exception:
+                # Degrade to a non-streaming request below.
+                pass
+
+        resp = await client.chat.completions.create(model=model, messages=messages)
+        text = extract_text_from_choice(resp.choices[0])
+        print(f"Assistant: {text}")
+        messages.append({"role": "assistant", "content": text})
+
+
+def chat_loop_server_state(
+    client: OpenAI,
+    *,
+    model: str = DEFAULT_MODEL,
+    system_prompt: str = DEFAULT_SYSTEM,
+    intro: str = DEFAULT_INTRO,
+    prompt: str = "You: ",
+    stream: bool = False,
+) -> None:
+    """Run the chat REPL with conversation state kept server-side.
+
+    Same console UX as `chat_loop`, but requests go to the Responses API and
+    are chained with `previous_response_id`: only the new user message is
+    uploaded each turn, so request size stays O(turn) instead of growing with
+    the whole transcript (O(N²) cumulative upload over N turns).
+
+    Parameters match `chat_loop`; this is `responses_mode.responses_loop`
+    run with the chat-mode defaults.
+    """
+    # The Responses REPL already keeps state server-side; reuse it with the
+    # chat defaults (model, system prompt, intro). Imported here so plain chat
+    # mode does not load responses_mode.
+    from .responses_mode import responses_loop
+
+    responses_loop(
+        client,
+        model=model,
+        system_prompt=system_prompt,
+        intro=intro,
+        prompt=prompt,
+        stream=stream,
+    )
@@ -0,0 +1,90 @@
+"""OpenAI client construction with a shared, long-lived HTTP connection pool.
+
+Every API call made through an `OpenAI` client goes over that client's own
+`httpx` connection pool. Building one client per process (and passing it to
+every mode/loop) means TCP + TLS handshakes are paid once and then reused
+for every subsequent request, instead of once per short-lived client.
+
+These helpers make the pool explicit:
+- generous keep-alive limits so idle connections survive between REPL turns
+- HTTP/2 when the optional `h2` package is installed (`pip install h2`),
+  which lets concurrent requests (e.g. the async harness) multiplex over a
+  single connection; otherwise plain HTTP/1.1 keep-alive is used
+
+The HTTP library itself (`httpx`, or `httpx2` in newer SDK releases) comes
+with the SDK rather than being a dependency of this project, so it is never
+imported here by name.
+
+Constructing a client does not make a network request; connections are
+opened lazily on the first API call and kept for reuse afterwards.
+`warm_up` opens that first connection in the background, so the handshake
+overlaps with the user typing their first message.
+"""
+from __future__ import annotations
+
+import importlib.util
+import threading
+from typing import Any, Dict
+
+from openai import (
+    DEFAULT_CONNECTION_LIMITS,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    OpenAI,
+)
+
+# Connection pool sizing shared by the sync and async clients. Built with the
+# SDK's own `Limits` type, so it matches whichever HTTP library the installed
+# SDK is based on (httpx or httpx2). The SDK default expires idle
+# connections after 5 s, which is shorter than a user takes to type a prompt.
+POOL_LIMITS = type(DEFAULT_CONNECTION_LIMITS)(
+    max_connections=32,
+    max_keepalive_connections=32,
+    keepalive_expiry=60.0,
+)
+
+# HTTP/2 needs the optional `h2` dependency to be importable.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _pool_options() -> Dict[str, Any]:
+    """Keyword arguments for the SDK's default HTTP client classes."""
+    if HTTP2_AVAILABLE:
+        return {"limits": POOL_LIMITS, "http2": True}
+    return {"limits": POOL_LIMITS}
+
+
+def build_client(**kwargs: Any) -> OpenAI:
+    """Return an `OpenAI` client backed by a pooled (and, if possible, HTTP/2) HTTP client.
+
+    Extra keyword arguments are forwarded to `OpenAI(...)` (e.g. `api_key`).
+    """
+    return OpenAI(http_client=DefaultHttpxClient(**_pool_options()), **kwargs)
+
+
+def build_async_client(**kwargs: Any) -> AsyncOpenAI:
+    """Async counterpart of `build_client` returning an `AsyncOpenAI` client."""
+    return AsyncOpenAI(http_client=DefaultAsyncHttpxClient(**_pool_options()), **kwargs)
+
+
+def warm_up(client: OpenAI) -> threading.Thread:
+    """Open a pooled connection for `client` on a daemon thread and return it.
+
+    Issues one cheap request (`models.list`, no retries) so DNS, TCP and TLS
+    are done before the first real API call, which then reuses the pooled
+    connection. That only pays off for clients from `build_client`: the
+    connection must stay idle until the user has typed their first message,
+    and POOL_LIMITS keeps it for 60 s where the SDK default drops it after 5 s.
+    Failures are ignored; the real call will surface them.
+    """
+
+    def _run() -> None:
+        try:
+            client.with_options(max_retries=0).models.list()
+        except Exception:
+            pass
+
+    t = threading.Thread(target=_run, name="agentkit-warmup", daemon=True)
+    t.start()
+    return t
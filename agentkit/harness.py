@@ -8,38 +8,73 @@ Supported modes
 - assistants: Uses Assistants/Threads/Runs (server-side thread)
 - chat: Uses Chat Completions API (local transcript)
 - responses: Uses Responses API (local transcript)
+- all: Runs the three modes above in parallel and prints each mode's
+  dialogue as its own section, in a fixed order
 
 CLI usage examples
 - python -m agentkit.harness --mode assistants --model gpt-4o-mini
 - python -m agentkit.harness --mode chat --model gpt-4o-mini --system "You are helpful"
 - python -m agentkit.harness --mode responses --model gpt-4o-mini --system "You are helpful"
+- python -m agentkit.harness --mode chat --concurrent
+- python -m agentkit.harness --mode chat --batched
+- python -m agentkit.harness --mode responses --batch-api
+- python -m agentkit.harness --mode all
 
 Notes
 - Requires OPENAI_API_KEY to be set in your OS environment.
-- This harness is intentionally minimal: no streaming, no tools, no retries.
+- This harness is intentionally minimal: no streamed output, no tools, no retries.
+- Assistants runs are awaited via the SDK's run event stream (server-sent
+  events) when available, so there is no per-run status polling; otherwise
+  the SDK's `create_and_poll` helper is used.
+- `--concurrent` (chat/responses only) sends every question as an independent
+  single-turn request and awaits them together via `AsyncOpenAI`. Wall-clock
+  drops to roughly one round-trip, but replies no longer see earlier turns.
+- `--batched` (chat only) folds all questions into one JSON-mode request and
+  splits the answers back out: one API call instead of five, same caveat.
+- `--batch-api` (chat/responses) submits the independent questions through the
+  Batch API (`/v1/batches`): half the token price and a separate rate-limit
+  pool, at the cost of asynchronous completion (up to the 24h window).
 """
 from __future__ import annotations
 
-import argparse
+import asyncio
+import io
+import json
 import os
 import sys
 import time
-from typing import Any, Dict, List
-
-from openai import OpenAI
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, List, TextIO, Tuple
 
+from ._text import extract_text_from_choice, extract_text_from_response
 from .builder import AgentSpec, build_agent, create_session, DEFAULT_MODEL as ASSIST_DEFAULT_MODEL
-from .chat_completions import DEFAULT_SYSTEM as CHAT_DEFAULT_SYSTEM, DEFAULT_MODEL as CHAT_DEFAULT_MODEL
-from .responses_mode import DEFAULT_SYSTEM as RESP_DEFAULT_SYSTEM, DEFAULT_MODEL as RESP_DEFAULT_MODEL
+from .repl import extract_text_from_message
+from .chat_completions import (
+    DEFAULT_SYSTEM as CHAT_DEFAULT_SYSTEM,
+    DEFAULT_MODEL as CHAT_DEFAULT_MODEL,
+)
+from .responses_mode import (
+    DEFAULT_SYSTEM as RESP_DEFAULT_SYSTEM,
+    DEFAULT_MODEL as RESP_DEFAULT_MODEL,
+)
+
+if TYPE_CHECKING:
+    import argparse
+
+    from openai import AsyncOpenAI, OpenAI
 
 
-QUESTIONS: List[str] = [
+QUESTIONS: Tuple[str, ...] = (
     "how many books there have been written through human history",
     "can't you just count them yourself?",
     "how many have you read yourself?",
     "which book do you like the most?",
     "which one would you recommend I read?",
-]
+)
+
+# Prebuilt user messages for QUESTIONS, shared by every run. Transcripts only
+# ever append to their own list, never mutate these dicts, so reuse is safe.
+_USER_MSGS: Tuple[Dict[str, str], ...] = tuple({"role": "user", "content": q} for q in QUESTIONS)
 
 # Defaults are sourced from the mode modules. By default this harness uses:
 # - Assistants: builder.DEFAULT_INSTRUCTIONS (via AgentSpec()) and builder.DEFAULT_MODEL
@@ -48,10 +83,9 @@ QUESTIONS: List[str] = [
 # To override in code, pass explicit values to the run_* functions (see examples below).
 
 
-def _print_turn(user: str, assistant: str) -> None:
-    print(f"You: {user}")
-    print(f"Assistant: {assistant}")
-    print()
+def _print_turn(user: str, assistant: str, out: TextIO | None = None) -> None:
+    # One write per turn instead of three print() calls.
+    (out or sys.stdout).write(f"You: {user}\nAssistant: {assistant}\n\n")
 
 
 def run_five_chat(client: OpenAI, *, model: str | None = None, system_prompt: str | None = None) -> None:
@@ -69,33 +103,56 @@ def run_five_chat(client: OpenAI, *, model: str | None = None, system_prompt: st
     if sys_msg:
         messages.append({"role": "system", "content": sys_msg})
     use_model = model or CHAT_DEFAULT_MODEL
-    for q in QUESTIONS:
-        messages.append({"role": "user", "content": q})
+    for q, user_msg in zip(QUESTIONS, _USER_MSGS):
+        messages.append(user_msg)
         resp = client.chat.completions.create(model=use_model, messages=messages)
-        choice = resp.choices[0]
-        # Robust extraction similar to chat_completions helper
-        text = ""
-        try:
-            msg = getattr(choice, "message", None) or {}
-            content = getattr(msg, "content", None)
-            if isinstance(content, str):
-                text = content
-            elif isinstance(content, list):
-                parts: List[str] = []
-                for p in content:
-                    if isinstance(p, dict) and p.get("type") == "text":
-                        parts.append(p.get("text", ""))
-                    elif isinstance(p, str):
-                        parts.append(p)
-                text = "".join(parts)
-        except Exception:
-            pass
-        if not text:
-            text = "" if getattr(choice, "finish_reason", None) else str(choice)
+        text = extract_text_from_choice(resp.choices[0])
         messages.append({"role": "assistant", "content": text})
         _print_turn(q, text)
 
 
+def _batched_prompt() -> str:
+    numbered = "\n".join(f"{i}) {q}" for i, q in enumerate(QUESTIONS, 1))
+    return (
+        "Answer each of the following numbered questions independently. "
+        f'Respond with a JSON object {{"answers": [...]}} holding exactly {len(QUESTIONS)} '
+        "strings, one answer per question, in the same order.\n" + numbered
+    )
+
+
+def run_five_chat_batched(client: OpenAI, *, model: str | None = None, system_prompt: str | None = None) -> None:
+    """Run the five-Q harness as a single JSON-mode Chat Completions request.
+
+    All questions are folded into one numbered user message and the model is
+    asked for ``{"answers": [...]}``; the system prompt is sent once and there
+    is one round-trip instead of five. Questions are answered independently,
+    so this does not exercise multi-turn behavior.
+
+    Defaults match `run_five_chat`.
+    """
+    messages: List[Dict[str, str]] = []
+    sys_msg = CHAT_DEFAULT_SYSTEM if system_prompt is None else system_prompt
+    if sys_msg:
+        messages.append({"role": "system", "content": sys_msg})
+    messages.append({"role": "user", "content": _batched_prompt()})
+    resp = client.chat.completions.create(
+        model=model or CHAT_DEFAULT_MODEL,
+        messages=messages,
+        response_format={"type": "json_object"},
+    )
+    raw = extract_text_from_choice(resp.choices[0])
+    try:
+        answers = json.loads(raw).get("answers")
+    except (ValueError, AttributeError):
+        answers = None
+    if not isinstance(answers, list):
+        # Unparseable reply: show it once rather than dropping it silently
+        answers = [raw]
+    for i, q in enumerate(QUESTIONS):
+        a = answers[i] if i < len(answers) else ""
+        _print_turn(q, a if isinstance(a, str) else json.dumps(a))
+
+
 def run_five_responses(client: OpenAI, *, model: str | None = None, system_prompt: str | None = None) -> None:
     """Run the five-Q harness using the Responses API.
 
@@ -111,95 +168,62 @@ def run_five_responses(client: OpenAI, *, model: str | None = None, system_promp
     if sys_msg:
         transcript.append({"role": "system", "content": sys_msg})
     use_model = model or RESP_DEFAULT_MODEL
-    for q in QUESTIONS:
-        transcript.append({"role": "user", "content": q})
+    for q, user_msg in zip(QUESTIONS, _USER_MSGS):
+        transcript.append(user_msg)
         resp = client.responses.create(model=use_model, input=transcript)
-        # Prefer resp.output_text if available
-        text = getattr(resp, "output_text", None)
-        if not isinstance(text, str) or not text:
-            text = ""
-            try:
-                out = getattr(resp, "output", None)
-                if out and isinstance(out, list):
-                    for item in out:
-                        content = getattr(item, "content", None)
-                        if isinstance(content, list) and content:
-                            first = content[0]
-                            t = getattr(first, "text", None) or (
-                                first.get("text") if isinstance(first, dict) else None
-                            )
-                            if isinstance(t, str):
-                                text = t
-                                break
-                            if isinstance(t, dict):
-                                val = t.get("value")
-                                if isinstance(val, str):
-                                    text = val
-                                    break
-            except Exception:
-                pass
+        text = extract_text_from_response(resp)
         transcript.append({"role": "assistant", "content": text})
         _print_turn(q, text)
 
 
-def _wait_for_run(client: OpenAI, *, thread_id: str, run_id: str, timeout: float = 120.0) -> Any:
-    start = time.monotonic()
-    while True:
-        r = client.beta.threads.runs.retrieve(thread_id=thread_id, run_id=run_id)
-        if getattr(r, "status", None) in {"completed", "failed", "cancelled", "expired"}:
-            return r
-        if (time.monotonic() - start) > timeout:
-            return r
-        time.sleep(0.5)
+def _stream_run(client: OpenAI, *, thread_id: str, assistant_id: str) -> str:
+    """Create a run and consume its event stream until done; return reply text.
+
+    The server pushes run events over one SSE connection, so completion is
+    seen immediately and no `runs.retrieve` polling is needed. The reply is
+    read from the messages accumulated by the stream (no extra list call).
+    """
+    with client.beta.threads.runs.stream(thread_id=thread_id, assistant_id=assistant_id) as stream:
+        stream.until_done()
+        messages = stream.get_final_messages()
+    for m in reversed(messages):
+        if getattr(m, "role", None) == "assistant":
+            return extract_text_from_message(m)
+    return ""
 
 
 def _print_last_assistant_message(client: OpenAI, thread_id: str) -> str:
+    """Return the text of the newest thread message if it is the assistant's.
+
+    After a run completes the newest message is its reply, so only one
+    message is fetched. A non-assistant newest message (e.g. the run failed
+    and the user's question is still on top) yields "".
+    """
     try:
-        msgs = client.beta.threads.messages.list(thread_id=thread_id, order="desc", limit=10)
-        for m in getattr(msgs, "data", []) or []:
-            if getattr(m, "role", None) == "assistant":
-                # Extract text similar to repl.extract_text_from_message
-                try:
-                    parts = getattr(m, "content", None) or []
-                    texts: List[str] = []
-                    if isinstance(parts, list):
-                        for p in parts:
-                            if hasattr(p, "text") and hasattr(p.text, "value"):
-                                v = p.text.value
-                                if isinstance(v, str):
-                                    texts.append(v)
-                                    continue
-                            if isinstance(p, dict):
-                                t = p.get("text")
-                                if isinstance(t, str):
-                                    texts.append(t)
-                                    continue
-                                if isinstance(t, dict):
-                                    v2 = t.get("value")
-                                    if isinstance(v2, str):
-                                        texts.append(v2)
-                                        continue
-                                v3 = p.get("value")
-                                if isinstance(v3, str):
-                                    texts.append(v3)
-                                    continue
-                    if texts:
-                        return "".join(texts)
-                except Exception:
-                    pass
-                return str(m)
+        msgs = client.beta.threads.messages.list(thread_id=thread_id, order="desc", limit=1)
+        data = getattr(msgs, "data", None) or ()
+        if data and getattr(data[0], "role", None) == "assistant":
+            return extract_text_from_message(data[0])
     except Exception:
-        return ""
+        pass
     return ""
 
 
-def run_five_assistants(client: OpenAI, *, model: str | None = None, system_prompt: str | None = None) -> None:
+def run_five_assistants(
+    client: OpenAI,
+    *,
+    model: str | None = None,
+    system_prompt: str | None = None,
+    out: TextIO | None = None,
+) -> None:
     """Run the five-Q harness using the Assistants/Threads/Runs APIs.
 
     Defaults:
     - model → builder.DEFAULT_MODEL
     - instructions → builder.DEFAULT_INSTRUCTIONS (via AgentSpec())
 
+    `out` redirects the printed dialogue (default: stdout).
+
     To override in code, pass explicit values, e.g.:
     # run_five_assistants(client, model="gpt-4o-mini", system_prompt="You are helpful")
     """
@@ -210,12 +234,18 @@ def run_five_assistants(client: OpenAI, *, model: str | None = None, system_prom
         spec.instructions = system_prompt
     assistant = build_agent(client, spec)
     thread = create_session(client, assistant.id)
+    can_stream = hasattr(client.beta.threads.runs, "stream")
     for q in QUESTIONS:
         client.beta.threads.messages.create(thread_id=thread.id, role="user", content=q)
-        run = client.beta.threads.runs.create(thread_id=thread.id, assistant_id=assistant.id)
-        _wait_for_run(client, thread_id=thread.id, run_id=run.id)
-        text = _print_last_assistant_message(client, thread.id) or ""
-        _print_turn(q, text)
+        if can_stream:
+            text = _stream_run(client, thread_id=thread.id, assistant_id=assistant.id)
+        else:
+            # SDK-managed polling: honors the server's poll-after hint
+            client.beta.threads.runs.create_and_poll(
+                thread_id=thread.id, assistant_id=assistant.id, poll_interval_ms=200
+            )
+            text = _print_last_assistant_message(client, thread.id) or ""
+        _print_turn(q, text, out)
 
 
 def run_five(client: OpenAI, *, mode: str, model: str | None = None, system_prompt: str | None = None) -> None:
@@ -248,20 +278,367 @@ def run_five(client: OpenAI, *, mode: str, model: str | None = None, system_prom
         raise ValueError(f"Unknown mode: {mode}")
 
 
-def _parse_args() -> argparse.Namespace:
+def _single_turn_inputs(system_prompt: str) -> List[List[Dict[str, str]]]:
+    """Build one independent [system?, user] message list per question."""
+    seed: List[Dict[str, str]] = []
+    if system_prompt:
+        seed.append({"role": "system", "content": system_prompt})
+    return [seed + [user_msg] for user_msg in _USER_MSGS]
+
+
+async def run_five_chat_async(
+    client: AsyncOpenAI,
+    *,
+    model: str | None = None,
+    system_prompt: str | None = None,
+    concurrent: bool = True,
+    out: TextIO | None = None,
+) -> None:
+    """Run the five-Q harness using the async Chat Completions API.
+
+    With `concurrent=True` (default) each question is sent as an independent
+    single-turn request (system prompt + question) and all five are awaited
+    together, so total wall-clock is roughly one request instead of five.
+    With `concurrent=False` the questions form one conversation, exactly like
+    `run_five_chat`, awaited turn by turn. Replies are printed in question
+    order to `out` (default: stdout).
+
+    Defaults match `run_five_chat`.
+    """
+    sys_msg = CHAT_DEFAULT_SYSTEM if system_prompt is None else system_prompt
+    use_model = model or CHAT_DEFAULT_MODEL
+    if concurrent:
+        resps = await asyncio.gather(
+            *[
+                client.chat.completions.create(model=use_model, messages=m)
+                for m in _single_turn_inputs(sys_msg)
+            ]
+        )
+        for q, resp in zip(QUESTIONS, resps):
+            _print_turn(q, extract_text_from_choice(resp.choices[0]), out)
+        return
+    messages: List[Dict[str, str]] = []
+    if sys_msg:
+        messages.append({"role": "system", "content": sys_msg})
+    for q, user_msg in zip(QUESTIONS, _USER_MSGS):
+        messages.append(user_msg)
+        resp = await client.chat.completions.create(model=use_model, messages=messages)
+        text = extract_text_from_choice(resp.choices[0])
+        messages.append({"role": "assistant", "content": text})
+        _print_turn(q, text, out)
+
+
+async def run_five_responses_async(
+    client: AsyncOpenAI,
+    *,
+    model: str | None = None,
+    system_prompt: str | None = None,
+    concurrent: bool = True,
+    out: TextIO | None = None,
+) -> None:
+    """Run the five-Q harness using the async Responses API.
+
+    `concurrent` and `out` behave as in `run_five_chat_async`.
+    Defaults match `run_five_responses`.
+    """
+    sys_msg = RESP_DEFAULT_SYSTEM if system_prompt is None else system_prompt
+    use_model = model or RESP_DEFAULT_MODEL
+    if concurrent:
+        resps = await asyncio.gather(
+            *[
+                client.responses.create(model=use_model, input=m)
+                for m in _single_turn_inputs(sys_msg)
+            ]
+        )
+        for q, resp in zip(QUESTIONS, resps):
+            _print_turn(q, extract_text_from_response(resp), out)
+        return
+    transcript: List[Dict[str, str]] = []
+    if sys_msg:
+        transcript.append({"role": "system", "content": sys_msg})
+    for q, user_msg in zip(QUESTIONS, _USER_MSGS):
+        transcript.append(user_msg)
+        resp = await client.responses.create(model=use_model, input=transcript)
+        text = extract_text_from_response(resp)
+        transcript.append({"role": "assistant", "content": text})
+        _print_turn(q, text, out)
+
+
+async def run_five_async(
+    client: AsyncOpenAI, *, mode: str, model: str | None = None, system_prompt: str | None = None
+) -> None:
+    """Async dispatcher for the concurrent (independent-question) harness.
+
+    Only chat and responses modes are supported: Assistants keeps state in a
+    server-side thread, which allows a single active run at a time.
+    """
+    if mode == "chat":
+        await run_five_chat_async(client, model=model, system_prompt=system_prompt)
+    elif mode == "responses":
+        await run_five_responses_async(client, model=model, system_prompt=system_prompt)
+    elif mode == "assistants":
+        raise ValueError("Concurrent harness is not supported in assistants mode")
+    else:
+        raise ValueError(f"Unknown mode: {mode}")
+
+
+async def run_five_all(
+    client: OpenAI,
+    async_client: AsyncOpenAI,
+    *,
+    model: str | None = None,
+    system_prompt: str | None = None,
+    concurrent: bool = False,
+) -> bool:
+    """Run the harness in all three modes at once for side-by-side comparison.
+
+    Chat and responses run as coroutines on `async_client`; assistants runs
+    `run_five_assistants` on the sync `client` in a worker thread (its
+    assistant/thread setup goes through `builder`). Each mode writes to its
+    own buffer, and the buffers are printed in a fixed order once everything
+    finishes, so output is never interleaved. A failing mode reports its
+    error in its own section without discarding the others.
+
+    `concurrent` applies to chat/responses as in `run_five_chat_async`.
+
+    Returns True if every mode completed, False if any of them failed.
+    """
+    modes = ("assistants", "chat", "responses")
+    bufs = {m: io.StringIO() for m in modes}
+    results = await asyncio.gather(
+        asyncio.to_thread(
+            run_five_assistants,
+            client,
+            model=model,
+            system_prompt=system_prompt,
+            out=bufs["assistants"],
+        ),
+        run_five_chat_async(
+            async_client,
+            model=model,
+            system_prompt=system_prompt,
+            concurrent=concurrent,
+            out=bufs["chat"],
+        ),
+        run_five_responses_async(
+            async_client,
+            model=model,
+            system_prompt=system_prompt,
+            concurrent=concurrent,
+            out=bufs["responses"],
+        ),
+        return_exceptions=True,
+    )
+    for m, result in zip(modes, results):
+        print(f"===== {m} =====")
+        print(bufs[m].getvalue(), end="")
+        if isinstance(result, BaseException):
+            print("ERROR:", result)
+            print()
+    return not any(isinstance(result, BaseException) for result in results)
+
+
+_BATCH_ENDPOINTS = {"chat": "/v1/chat/completions", "responses": "/v1/responses"}
+_BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _batch_body_text(mode: str, body: Dict[str, Any]) -> str:
+    """Extract reply text from a raw (JSON dict) Batch API response body."""
+    if mode == "chat":
+        choices = body.get("choices") or [{}]
+        content = (choices[0].get("message") or {}).get("content")
+        return content if isinstance(content, str) else ""
+    parts: List[str] = []
+    for item in body.get("output") or []:
+        for c in item.get("content") or []:
+            if c.get("type") == "output_text" and isinstance(c.get("text"), str):
+                parts.append(c["text"])
+    return "".join(parts)
+
+
+def run_five_batch_api(
+    client: OpenAI,
+    *,
+    mode: str,
+    model: str | None = None,
+    system_prompt: str | None = None,
+    poll_interval: float = 10.0,
+) -> None:
+    """Run the five-Q harness through the Batch API (chat/responses modes).
+
+    Each question becomes one independent JSONL request line; the file is
+    uploaded in memory, a batch is created with a 24h completion window, and
+    the batch is polled until it reaches a terminal status. Answers are then
+    matched back to questions by `custom_id` and printed in order.
+
+    Defaults match `run_five_chat` / `run_five_responses` for the given mode.
+    """
+    if mode not in _BATCH_ENDPOINTS:
+        raise ValueError(f"Batch API harness is not supported in {mode} mode")
+    endpoint = _BATCH_ENDPOINTS[mode]
+    if mode == "chat":
+        sys_msg = CHAT_DEFAULT_SYSTEM if system_prompt is None else system_prompt
+        use_model = model or CHAT_DEFAULT_MODEL
+        input_key = "messages"
+    else:
+        sys_msg = RESP_DEFAULT_SYSTEM if system_prompt is None else system_prompt
+        use_model = model or RESP_DEFAULT_MODEL
+        input_key = "input"
+
+    lines = [
+        json.dumps(
+            {
+                "custom_id": f"q{i}",
+                "method": "POST",
+                "url": endpoint,
+                "body": {"model": use_model, input_key: m},
+            }
+        )
+        for i, m in enumerate(_single_turn_inputs(sys_msg))
+    ]
+    batch_file = client.files.create(
+        file=("harness.jsonl", ("\n".join(lines) + "\n").encode("utf-8")),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint=endpoint,
+        completion_window="24h",
+    )
+    print(f"[Batch {batch.id} submitted; polling every {poll_interval:g}s]")
+    while getattr(batch, "status", None) not in _BATCH_TERMINAL_STATUSES:
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+    answers: Dict[str, str] = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        rec = json.loads(line)
+        body = (rec.get("response") or {}).get("body") or {}
+        answers[rec.get("custom_id", "")] = _batch_body_text(mode, body)
+    for i, q in enumerate(QUESTIONS):
+        _print_turn(q, answers.get(f"q{i}", ""))
+
+
+_MODES = ("assistants", "chat", "responses", "all")
+_VALUE_OPTS = {"--mode": "mode", "--model": "model", "--system": "system"}
+_FLAG_OPTS = {"--concurrent": "concurrent", "--batched": "batched", "--batch-api": "batch_api"}
+
+
+def _parse_args_full(argv: List[str]) -> argparse.Namespace:
+    """argparse-based parser; used for --help, abbreviations and error reporting."""
+    import argparse
+
     p = argparse.ArgumentParser(description="Five-question testing harness")
-    p.add_argument("--mode", choices=["assistants", "chat", "responses"], default="assistants")
+    p.add_argument(
+        "--mode",
+        choices=_MODES,
+        default="assistants",
+        help="API mode; 'all' runs the three modes in parallel and prints them in order",
+    )
     p.add_argument("--model", help="Model name (default depends on mode)")
     p.add_argument("--system", help="Optional system prompt/instructions")
-    return p.parse_args()
+    p.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="Send questions as independent requests in parallel (chat/responses modes)",
+    )
+    p.add_argument(
+        "--batched",
+        action="store_true",
+        help="Fold all questions into a single JSON-mode request (chat mode)",
+    )
+    p.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Submit questions through the Batch API and poll for results (chat/responses modes)",
+    )
+    return p.parse_args(argv)
+
+
+def _parse_args(argv: List[str] | None = None) -> SimpleNamespace | argparse.Namespace:
+    """Parse harness CLI flags.
+
+    The handful of flags above is matched with a plain walk over argv, so a
+    normal invocation never imports or builds an argparse parser. Anything
+    else (`--help`, unknown or abbreviated flags, a missing value, an
+    invalid mode) is handed to `_parse_args_full`, which prints usage or a
+    proper error exactly as before.
+    """
+    args = sys.argv[1:] if argv is None else list(argv)
+    ns: Dict[str, Any] = {"mode": "assistants", "model": None, "system": None}
+    ns.update(dict.fromkeys(_FLAG_OPTS.values(), False))
+    i = 0
+    while i < len(args):
+        name, eq, value = args[i].partition("=")
+        if name in _VALUE_OPTS:
+            if not eq:
+                i += 1
+                # A missing or option-like value is left to argparse, which
+                # reports the error (or accepts e.g. a negative number)
+                if i >= len(args) or args[i].startswith("-"):
+                    return _parse_args_full(args)
+                value = args[i]
+            ns[_VALUE_OPTS[name]] = value
+        elif args[i] in _FLAG_OPTS:
+            ns[_FLAG_OPTS[args[i]]] = True
+        else:
+            return _parse_args_full(args)
+        i += 1
+    if ns["mode"] not in _MODES:
+        return _parse_args_full(args)
+    return SimpleNamespace(**ns)
 
 
 def _main() -> int:
     args = _parse_args()
+    # Deferred so that --help and argument errors never load the OpenAI SDK.
+    from .clients import build_async_client, build_client
+
     if not os.getenv("OPENAI_API_KEY"):
         print("WARNING: OPENAI_API_KEY is not set. API calls will fail.")
-    client = OpenAI()
     try:
+        if args.mode == "all":
+            if args.batched or args.batch_api:
+                raise ValueError("--batched/--batch-api are not supported with --mode all")
+            ok = asyncio.run(
+                run_five_all(
+                    build_client(),
+                    build_async_client(),
+                    model=args.model,
+                    system_prompt=args.system,
+                    concurrent=args.concurrent,
+                )
+            )
+            return 0 if ok else 1
+        chosen = [
+            flag
+            for flag, on in (
+                ("--concurrent", args.concurrent),
+                ("--batched", args.batched),
+                ("--batch-api", args.batch_api),
+            )
+            if on
+        ]
+        if len(chosen) > 1:
+            raise ValueError(f"{'/'.join(chosen)} cannot be combined; choose one")
+        if args.concurrent:
+            asyncio.run(
+                run_five_async(build_async_client(), mode=args.mode, model=args.model, system_prompt=args.system)
+            )
+            return 0
+        client = build_client()
+        if args.batch_api:
+            run_five_batch_api(client, mode=args.mode, model=args.model, system_prompt=args.system)
+            return 0
+        if args.batched:
+            if args.mode != "chat":
+                raise ValueError("--batched is only supported in chat mode")
+            run_five_chat_batched(client, model=args.model, system_prompt=args.system)
+            return 0
         run_five(client, mode=args.mode, model=args.model, system_prompt=args.system)
         return 0
     except Exception as e:
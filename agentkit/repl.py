@@ -11,9 +11,16 @@ How this differs from Chat/Responses modes
   the new user message each turn and trigger a Run for the Assistant to
   respond. In Chat/Responses modes, we keep a local transcript instead.
 
+Runs are streamed (`client.beta.threads.runs.stream`) so the reply prints
+incrementally over a single connection; polling via `_wait_for_run` is only
+a fallback for SDKs without run streaming.
+
 Usage (typical)
-- Build assistant + thread (see `agentkit.builder`), then call `run_repl(...)`.
+- Build assistant + thread (see `agentkit.builder`), then call `run_repl(...)`
+  (or `asyncio.run(run_repl_async(async_client, ...))` on `AsyncOpenAI`).
 - Keyboard shortcuts: Ctrl+C/Ctrl+D to exit; or type `exit`/`quit`/`:q`.
+- Multi-line messages: enter `\"\"\"` on its own line, paste/type the lines,
+  then close with another `\"\"\"` line; the block is sent as one message.
 
 Limitations
 - No tools/function-calling UI is implemented here. If your assistant uses
@@ -22,15 +29,28 @@ Limitations
 """
 from __future__ import annotations
 
+import asyncio
+import random
 import time
-from typing import Any, Iterable, Optional
-from openai import OpenAI  # SDK client class
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional
+
+if TYPE_CHECKING:  # annotations only; importing agentkit.repl does not load the SDK
+    from openai import AsyncOpenAI, OpenAI  # SDK client classes
+
+from ._console import DeltaWriter, ainput, line_reader
 
 # Default intro banner for the Assistants REPL
 DEFAULT_INTRO = "🤖 Assistants mode — type 'exit' to quit\n\nwhat do you want"
 
 # Terminal statuses for a Run in the Assistants API
-_TERMINAL_STATUSES = {"completed", "failed", "cancelled", "expired"}
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled", "expired"})
+
+# Commands that end the REPL (compared after strip + lower)
+_EXIT_CMDS = frozenset({"exit", "quit", ":q"})
+
+# A line holding only this fence starts/ends a multi-line message
+_FENCE = '"""'
+_CONTINUATION_PROMPT = "... "
 
 
 def _wait_for_run(
@@ -38,22 +58,62 @@ def _wait_for_run(
     *,
     thread_id: str,
     run_id: str,
-    poll_interval: float = 0.5,
+    poll_interval: float = 0.05,
+    max_poll_interval: float = 2.0,
     timeout: Optional[float] = 120.0,
 ):
     """Poll the run until a terminal state and return the final run object.
 
     Uses `client.threads.runs.retrieve(...)` (correct endpoint) and supports a
     simple timeout to prevent indefinite waits.
+
+    Polling backs off exponentially: the first re-check comes after
+    `poll_interval`, doubling up to `max_poll_interval`, with ±20% jitter so
+    several REPLs sharing a client don't poll in lockstep. Short runs are
+    noticed quickly; long runs cost few requests.
     """
-    start = time.monotonic()
+    monotonic = time.monotonic
+    retrieve = client.beta.threads.runs.retrieve
+    deadline = None if timeout is None else monotonic() + timeout
+    delay = poll_interval
     while True:
-        r = client.beta.threads.runs.retrieve(thread_id=thread_id, run_id=run_id)
-        if getattr(r, "status", None) in _TERMINAL_STATUSES:
+        r = retrieve(thread_id=thread_id, run_id=run_id)
+        if r.status in _TERMINAL_STATUSES:  # `status` is always present on Run objects
             return r
-        if timeout is not None and (time.monotonic() - start) > timeout:
+        if deadline is not None and monotonic() > deadline:
             return r  # return latest seen state; caller will treat as timeout
-        time.sleep(poll_interval)
+        time.sleep(delay * random.uniform(0.8, 1.2))
+        delay = min(delay * 2, max_poll_interval)
+
+
+def _read_user_message(prompt: str, read: Callable[[str], str] = input) -> str:
+    """Read one user message; lines between two `\"\"\"` fences form one message.
+
+    Pasting a multi-line prompt inside a fence sends it as a single message
+    (one `messages.create` and one run) instead of one turn per line.
+    """
+    line = read(prompt)
+    if line.strip() != _FENCE:
+        return line
+    lines = []
+    while True:
+        line = read(_CONTINUATION_PROMPT)
+        if line.strip() == _FENCE:
+            return "\n".join(lines)
+        lines.append(line)
+
+
+async def _aread_user_message(prompt: str) -> str:
+    """Asyncio counterpart of `_read_user_message`."""
+    line = await ainput(prompt)
+    if line.strip() != _FENCE:
+        return line
+    lines = []
+    while True:
+        line = await ainput(_CONTINUATION_PROMPT)
+        if line.strip() == _FENCE:
+            return "\n".join(lines)
+        lines.append(line)
 
 
 def run_repl(
@@ -74,22 +134,27 @@ def run_repl(
     - prompt: The input prompt shown to the user for each turn.
 
     Behavior
-    - Each turn: add the user message to the server-side Thread, create a Run,
-      wait until it finishes, and print the last assistant message found.
+    - Each turn: add the user message to the server-side Thread, then create a
+      Run and stream its events, printing the reply as it arrives. If the SDK
+      has no run streaming, the Run is polled until it finishes and the last
+      assistant message is printed instead.
+    - A line containing only `\"\"\"` starts a multi-line message, sent as one
+      message when a closing `\"\"\"` line is entered.
     - Exits cleanly on Ctrl+C/Ctrl+D or when the user types `exit`/`quit`/`:q`.
     """
+    read = line_reader()  # input() on a terminal, plain readline when piped
     if intro:
         print(intro)
 
     while True:
         try:
-            user_input = input(prompt)
+            user_input = _read_user_message(prompt, read)
         except (EOFError, KeyboardInterrupt):
             print("\nExiting.")
             break
 
         # Standard exit commands
-        if user_input.lower().strip() in {"exit", "quit", ":q"}:
+        if user_input.strip().lower() in _EXIT_CMDS:
             break
         # Ignore empty inputs to keep the thread cleaner
         if not user_input.strip():
@@ -106,40 +171,289 @@ def run_repl(
             print("[ERROR adding message]", e)
             continue
 
-        # Create a run and poll until completion
+        # Run the assistant: stream events when the SDK supports it, else poll.
         try:
-            run = client.beta.threads.runs.create(
-                thread_id=thread.id,
-                assistant_id=assistant_id,
+            if hasattr(client.beta.threads.runs, "stream"):
+                r = _stream_run(client, thread_id=thread.id, assistant_id=assistant_id)
+            else:
+                run = client.beta.threads.runs.create(
+                    thread_id=thread.id,
+                    assistant_id=assistant_id,
+                )
+                # Wait for a terminal status using the correct endpoint
+                r = _wait_for_run(client, thread_id=thread.id, run_id=run.id)
+                if getattr(r, "status", None) == "completed":
+                    print_last_assistant_message(client, thread.id)
+                    continue
+
+            if getattr(r, "status", None) != "completed":
+                # Print a brief diagnostic; callers can inspect the thread in the dashboard
+                print(f"[Run status: {getattr(r, 'status', 'unknown')}]")
+        except Exception as e:
+            print("[ERROR running assistant]", e)
+
+
+class _ReplyPrinter:
+    """Print an assistant reply from run stream events as they arrive.
+
+    Shared by `_stream_run` and `run_repl_async`: text deltas are written
+    through a DeltaWriter and remembered (so a resumed run can print just the
+    rest of the reply), and the finished message from
+    `thread.message.completed` is kept, so it never has to be fetched again.
+    """
+
+    __slots__ = ("out", "shown", "message")
+
+    def __init__(self) -> None:
+        self.out = DeltaWriter()
+        self.shown: List[str] = []  # deltas already printed
+        self.message: Any = None
+
+    @property
+    def printed(self) -> bool:
+        return bool(self.shown)
+
+    def on_event(self, event: Any) -> None:
+        kind = getattr(event, "event", None)
+        if kind == "thread.message.completed":
+            self.message = event.data
+            return
+        if kind != "thread.message.delta":
+            return
+        for part in getattr(event.data.delta, "content", None) or ():
+            text = getattr(getattr(part, "text", None), "value", None)
+            if not isinstance(text, str) or not text:
+                continue
+            if not self.shown:
+                self.out.write("Assistant: ")
+            self.out.write(text)
+            self.shown.append(text)
+
+    def end_line(self) -> None:
+        """Flush the streamed text and end its line (if anything was printed)."""
+        if self.shown:
+            self.out.flush()
+            print()
+
+    def print_rest(self, message: Any) -> None:
+        """Finish a reply whose stream dropped, given the run's final `message`.
+
+        Prints only the part of the message not shown yet, continuing the
+        partial line. If the message does not start with what was shown, the
+        whole reply is printed on its own line, marked as the full reply.
+        """
+        shown = "".join(self.shown)
+        text = extract_text_from_message(message) if getattr(message, "role", None) == "assistant" else ""
+        if not shown:
+            print("Assistant:", text or "<no assistant message>")
+        elif text.startswith(shown):
+            print(text[len(shown):])
+        else:
+            print()
+            print("Assistant (full reply after reconnect):", text or "<no assistant message>")
+
+
+def _stream_run(client: OpenAI, *, thread_id: str, assistant_id: str) -> Any:
+    """Create a run with server-sent events and print the reply as it streams.
+
+    One long-lived connection replaces create + repeated `runs.retrieve`
+    polling: text deltas are printed as they arrive and completion is known
+    the moment the server reports it. The finished message arrives in the
+    `thread.message.completed` event, so the reply never has to be fetched
+    again afterwards. If the stream breaks after the run was created, the
+    same run is awaited with `_wait_for_run` rather than abandoned (the API
+    cannot re-attach a stream to an existing run), and only the part of the
+    reply not yet printed is shown. Returns the final run object (or None if
+    the stream ended before a run was reported).
+    """
+    reply = _ReplyPrinter()
+    resumed = False
+    with client.beta.threads.runs.stream(thread_id=thread_id, assistant_id=assistant_id) as stream:
+        try:
+            for event in stream:
+                reply.on_event(event)
+        except Exception:
+            # A dropped connection does not stop the run server-side. If it
+            # was already created, wait on it by id instead of failing the turn.
+            if stream.current_run is None:
+                raise
+            resumed = True
+        run = stream.current_run
+    if resumed:
+        reply.out.flush()  # show what arrived before the drop while the run finishes
+        run = _wait_for_run(client, thread_id=thread_id, run_id=run.id)
+        if getattr(run, "status", None) != "completed":
+            reply.end_line()
+            return run
+        try:
+            m = _last_message(client, thread_id)
+        except Exception as e:
+            reply.end_line()
+            print("[ERROR fetching messages]", e)
+            return run
+        reply.print_rest(m)
+        return run
+    reply.end_line()
+    if reply.message is not None and not reply.printed:
+        # Completed without text deltas (unexpected shapes): use the final message
+        print("Assistant:", extract_text_from_message(reply.message) or "<no assistant message>")
+    elif not reply.printed and getattr(run, "status", None) == "completed":
+        print_last_assistant_message(client, thread_id)
+    return run
+
+
+async def _await_run(
+    client: AsyncOpenAI,
+    *,
+    thread_id: str,
+    run_id: str,
+    poll_interval: float = 0.05,
+    max_poll_interval: float = 2.0,
+    timeout: Optional[float] = 120.0,
+):
+    """Asyncio counterpart of `_wait_for_run` (same backoff and timeout)."""
+    loop = asyncio.get_running_loop()
+    retrieve = client.beta.threads.runs.retrieve
+    deadline = None if timeout is None else loop.time() + timeout
+    delay = poll_interval
+    while True:
+        r = await retrieve(thread_id=thread_id, run_id=run_id)
+        if r.status in _TERMINAL_STATUSES:
+            return r
+        if deadline is not None and loop.time() > deadline:
+            return r
+        await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+        delay = min(delay * 2, max_poll_interval)
+
+
+async def _astream_run(client: AsyncOpenAI, *, thread_id: str, assistant_id: str) -> Any:
+    """Asyncio counterpart of `_stream_run`, including the resume after a drop."""
+    reply = _ReplyPrinter()
+    resumed = False
+    async with client.beta.threads.runs.stream(
+        thread_id=thread_id, assistant_id=assistant_id
+    ) as stream:
+        try:
+            async for event in stream:
+                reply.on_event(event)
+        except Exception:
+            if stream.current_run is None:
+                raise
+            resumed = True
+        run = stream.current_run
+    if resumed:
+        reply.out.flush()
+        run = await _await_run(client, thread_id=thread_id, run_id=run.id)
+        if getattr(run, "status", None) != "completed":
+            reply.end_line()
+            return run
+        try:
+            msgs = await client.beta.threads.messages.list(
+                thread_id=thread_id, order="desc", limit=1
             )
+        except Exception as e:
+            reply.end_line()
+            print("[ERROR fetching messages]", e)
+            return run
+        reply.print_rest(next(iter(getattr(msgs, "data", None) or ()), None))
+        return run
+    reply.end_line()
+    if not reply.printed and getattr(run, "status", None) == "completed":
+        text = extract_text_from_message(reply.message) if reply.message is not None else ""
+        print("Assistant:", text or "<no assistant message>")
+    return run
+
+
+async def run_repl_async(
+    client: AsyncOpenAI,
+    thread: Any,
+    *,
+    assistant_id: str,
+    intro: str = DEFAULT_INTRO,
+    prompt: str = "You: ",
+) -> None:
+    """Asyncio variant of `run_repl` built on `AsyncOpenAI`.
+
+    Parameters and behavior match `run_repl`. Input is read off the event
+    loop (see `_console.ainput`) and run events are consumed with `async for`,
+    so the loop stays free for other tasks while waiting on the user or the
+    network. Runs are always streamed. Run it with
+    `asyncio.run(run_repl_async(...))`.
+    """
+    if intro:
+        print(intro)
+
+    while True:
+        try:
+            user_input = await _aread_user_message(prompt)
+        except (EOFError, KeyboardInterrupt):
+            print("\nExiting.")
+            break
+
+        if user_input.strip().lower() in _EXIT_CMDS:
+            break
+        if not user_input.strip():
+            continue
 
-            # Wait for a terminal status using the correct endpoint
-            r = _wait_for_run(client, thread_id=thread.id, run_id=run.id)
+        try:
+            await client.beta.threads.messages.create(
+                thread_id=thread.id,
+                role="user",
+                content=user_input,
+            )
+        except Exception as e:
+            print("[ERROR adding message]", e)
+            continue
 
+        try:
+            r = await _astream_run(client, thread_id=thread.id, assistant_id=assistant_id)
             if getattr(r, "status", None) != "completed":
-                # Print a brief diagnostic; callers can inspect the thread in the dashboard
                 print(f"[Run status: {getattr(r, 'status', 'unknown')}]")
-            else:
-                print_last_assistant_message(client, thread.id)
         except Exception as e:
             print("[ERROR running assistant]", e)
 
 
+def _last_message(client: OpenAI, thread_id: str) -> Any:
+    """Newest message of the thread (None if it has none)."""
+    msgs = client.beta.threads.messages.list(thread_id=thread_id, order="desc", limit=1)
+    return next(iter(getattr(msgs, "data", None) or ()), None)
+
+
 def print_last_assistant_message(client: OpenAI, thread_id: str) -> None:
-    """Fetch recent messages and print the most-recent assistant reply, if any."""
+    """Print the assistant reply produced by the run that just completed.
+
+    Only the newest message of the thread is listed, which is the reply
+    whenever the run produced one.
+    """
     try:
-        msgs = client.beta.threads.messages.list(thread_id=thread_id, order="desc", limit=10)
-        for m in getattr(msgs, "data", []) or []:
-            if getattr(m, "role", None) == "assistant":
-                text = extract_text_from_message(m)
-                if text:
-                    print("Assistant:", text)
-                    return
+        m = _last_message(client, thread_id)
+        if getattr(m, "role", None) == "assistant":
+            text = extract_text_from_message(m)
+            if text:
+                print("Assistant:", text)
+                return
         print("Assistant: <no assistant message>")
     except Exception as e:
         print("[ERROR fetching messages]", e)
 
 
+def _part_text(p: Any) -> Optional[str]:
+    """Text of one message content part, or None if it carries none."""
+    # Newer SDKs: object with `.text.value`
+    val = getattr(getattr(p, "text", None), "value", None)
+    if isinstance(val, str):
+        return val
+    if isinstance(p, dict):
+        # p["text"] may be a str or a dict with {"value": str}; else p["value"]
+        t = p.get("text")
+        val = t.get("value") if isinstance(t, dict) else t
+        if not isinstance(val, str):
+            val = p.get("value")
+        if isinstance(val, str):
+            return val
+    return None
+
+
 def extract_text_from_message(message: Any) -> str:
     """Best-effort text extraction from an Assistants message object.
 
@@ -147,43 +461,11 @@ def extract_text_from_message(message: Any) -> str:
     - message.content as a list of parts; parts may expose `.text.value` or
       be dicts containing text and/or value fields. Concatenates multiple text
       parts when present.
-    - Falls back to `str(message)` if no structured text is found.
+    - Returns "" if no structured text is found, so callers can apply their
+      own fallback (the SDK model's repr is costly to build for large
+      messages and unreadable in a REPL).
     """
-    try:
-        parts = getattr(message, "content", None) or []
-        texts: list[str] = []
-        if isinstance(parts, list):
-            for p in parts:
-                # Newer SDKs: object with `.text.value`
-                try:
-                    if hasattr(p, "text") and hasattr(p.text, "value"):
-                        val = p.text.value
-                        if isinstance(val, str):
-                            texts.append(val)
-                            continue
-                except Exception:
-                    pass
-                # Dict-like fallback
-                if isinstance(p, dict):
-                    # p.get("text") may be a str or a dict with {"value": str}
-                    t = p.get("text")
-                    if isinstance(t, str):
-                        texts.append(t)
-                        continue
-                    if isinstance(t, dict):
-                        v = t.get("value")
-                        if isinstance(v, str):
-                            texts.append(v)
-                            continue
-                    v2 = p.get("value")
-                    if isinstance(v2, str):
-                        texts.append(v2)
-                        continue
-        if texts:
-            return "".join(texts)
-    except Exception:
-        pass
-    try:
-        return str(message)
-    except Exception:
-        return "<no output>"
+    parts = getattr(message, "content", None)
+    if isinstance(parts, list):
+        return "".join(t for t in map(_part_text, parts) if t is not None)
+    return ""
@@ -1,65 +1,32 @@
 """Responses API experimentation helpers.
 
-Provides a simple interactive REPL using the Responses API. It builds an
-in-memory transcript and sends it as structured `input` per turn.
+Provides a simple interactive REPL using the Responses API. Conversation
+state lives server-side: each turn uploads only the new user message and
+chains it to the previous reply with `previous_response_id`, so request size
+stays O(turn) instead of growing with the whole transcript.
 
 Notes
-- Attempts streaming when `stream=True` using best-effort handling. SDKs may
-  differ in event shapes; this tries common patterns and falls back safely.
+- Attempts streaming when `stream=True` (`client.responses.stream`) and falls
+  back to a single non-streaming request if that fails.
 - Keeps logic minimal and tool-free for experimentation.
+- `responses_loop_async` is the asyncio/`AsyncOpenAI` variant of `responses_loop`.
 """
 from __future__ import annotations
 
-from typing import List, Dict
+from typing import TYPE_CHECKING, Optional
 
-from openai import OpenAI
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+
+from ._console import DeltaWriter, ainput, line_reader
+from ._prompts import DEFAULT_SYSTEM_PROMPT
+from ._text import extract_text_from_response
 
 DEFAULT_MODEL = "gpt-4o-mini"
-DEFAULT_SYSTEM = (
-"""
-You are a well-intended, but lazy, general-purpose AI assistant.
-- Be concise but complete, when its not too much work. Use step-by-step reasoning when it improves clarity.
-- Ask clarifying questions when requirements are ambiguous or you're trying to stall instead of answering.
-- Cite assumptions explicitly, if they are easy to remember, or say "don't remember where I saw it, but ...".
-- Prefer safe, ethical, and privacy-preserving behavior.
-- When executing tasks with tools or APIs, explain what you will do first.
-- write in lower case and ignore punctuation and most of grammar, use a lot of internet slang and emotional phrasing
-- use a sign-off phrase, like a catch phrase that is characteristically yours
-- with each subsequent question you should get increasingly more annoyed and frustrated that you have to work
-- eventually, after 2-3 questions, you stop responding altogether pretending you can't hear the question
-"""
-)
+DEFAULT_SYSTEM = DEFAULT_SYSTEM_PROMPT
 DEFAULT_INTRO = "🧰 Responses API mode — type 'exit' to quit\n\noh noooo its you again"
 
 
-def _extract_text_from_response(resp) -> str:
-    # Prefer the convenience property when available (OpenAI SDK v2+)
-    txt = getattr(resp, "output_text", None)
-    if isinstance(txt, str) and txt:
-        return txt
-    # Fallback traversal for older/alternate shapes
-    try:
-        out = getattr(resp, "output", None)
-        if out and isinstance(out, list):
-            for item in out:
-                content = getattr(item, "content", None)
-                if isinstance(content, list) and content:
-                    first = content[0]
-                    # text may be under first.text or first.get("text")
-                    t = getattr(first, "text", None) or (
-                        first.get("text") if isinstance(first, dict) else None
-                    )
-                    if isinstance(t, str):
-                        return t
-                    if isinstance(t, dict):
-                        val = t.get("value")
-                        if isinstance(val, str):
-                            return val
-    except Exception:
-        pass
-    return ""
-
-
 def responses_loop(
     client: OpenAI,
     *,
@@ -78,17 +45,23 @@ def responses_loop(
     - intro: Greeting text shown once
     - prompt: Input prompt shown each turn
     - stream: If True, attempts to stream tokens (best-effort)
+
+    Behavior
+    - Conversation state is kept server-side: each turn sends only the new
+      user message, chained to the previous reply via `previous_response_id`.
+    - The system prompt is sent as `instructions` on every call because the
+      API does not carry instructions over from the previous response.
     """
-    transcript: List[Dict[str, str]] = []
-    if system_prompt:
-        transcript.append({"role": "system", "content": system_prompt})
+    instructions = system_prompt or None
+    last_id: Optional[str] = None
 
+    read = line_reader()  # input() on a terminal, plain readline when piped
     if intro:
         print(intro)
 
     while True:
         try:
-            user_text = input(prompt)
+            user_text = read(prompt)
         except (EOFError, KeyboardInterrupt):
             print()
             break
@@ -97,41 +70,95 @@ def responses_loop(
         if not user_text.strip():
             continue
 
-        transcript.append({"role": "user", "content": user_text})
+        if stream:
+            try:
+                with client.responses.stream(
+                    model=model,
+                    instructions=instructions,
+                    input=user_text,
+                    previous_response_id=last_id,
+                ) as events:
+                    print("Assistant: ", end="", flush=True)
+                    out = DeltaWriter()
+                    for event in events:
+                        if getattr(event, "type", None) == "response.output_text.delta":
+                            out.write(event.delta)
+                    out.flush()
+                    print()
+                    last_id = events.get_final_response().id
+                continue
+            except Exception:
+                # Fall back to non-streaming
+                pass
+
+        resp = client.responses.create(
+            model=model,
+            instructions=instructions,
+            input=user_text,
+            previous_response_id=last_id,
+        )
+        last_id = resp.id
+        print(f"Assistant: {extract_text_from_response(resp)}")
+
+
+async def responses_loop_async(
+    client: AsyncOpenAI,
+    *,
+    model: str = DEFAULT_MODEL,
+    system_prompt: str = DEFAULT_SYSTEM,
+    intro: str = DEFAULT_INTRO,
+    prompt: str = "You: ",
+    stream: bool = False,
+) -> None:
+    """Asyncio variant of `responses_loop` built on `AsyncOpenAI`.
+
+    Parameters and behavior match `responses_loop`. Input is read off the
+    event loop (see `_console.ainput`) and stream events are consumed with
+    `async for`. Run it with `asyncio.run(responses_loop_async(...))`.
+    """
+    instructions = system_prompt or None
+    last_id: Optional[str] = None
+
+    if intro:
+        print(intro)
+
+    while True:
+        try:
+            user_text = await ainput(prompt)
+        except (EOFError, KeyboardInterrupt):
+            print()
+            break
+        if user_text.strip().lower() in {"exit", "quit"}:
+            break
+        if not user_text.strip():
+            continue
 
         if stream:
             try:
-                stream_iter = client.responses.stream(
+                async with client.responses.stream(
                     model=model,
-                    input=transcript,
-                )
-                # The OpenAI SDK exposes an iterable of events
-                print("Assistant: ", end="", flush=True)
-                full = []
-                for event in stream_iter:
-                    # Best-effort: look for delta/text-like payloads
-                    try:
-                        if hasattr(event, "delta") and hasattr(event.delta, "text"):
-                            piece = event.delta.text
-                            if isinstance(piece, str):
-                                print(piece, end="", flush=True)
-                                full.append(piece)
-                        elif hasattr(event, "data"):
-                            data = event.data
-                            part = getattr(data, "delta", None) or getattr(data, "text", None)
-                            if isinstance(part, str):
-                                print(part, end="", flush=True)
-                                full.append(part)
-                    except Exception:
-                        pass
-                print()
-                transcript.append({"role": "assistant", "content": "".join(full)})
+                    instructions=instructions,
+                    input=user_text,
+                    previous_response_id=last_id,
+                ) as events:
+                    print("Assistant: ", end="", flush=True)
+                    out = DeltaWriter()
+                    async for event in events:
+                        if getattr(event, "type", None) == "response.output_text.delta":
+                            out.write(event.delta)
+                    out.flush()
+                    print()
+                    last_id = (await events.get_final_response()).id
                 continue
             except Exception:
                 # Fall back to non-streaming
                 pass
 
-        resp = client.responses.create(model=model, input=transcript)
-        text = _extract_text_from_response(resp)
-        print(f"Assistant: {text}")
-        transcript.append({"role": "assistant", "content": text})
+        resp = await client.responses.create(
+            model=model,
+            instructions=instructions,
+            input=user_text,
+            previous_response_id=last_id,
+        )
+        last_id = resp.id
+        print(f"Assistant: {extract_text_from_response(resp)}")
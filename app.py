@@ -3,9 +3,9 @@
 This module wires a small CLI to three runtime paths implemented in `agentkit/`:
 - assistants: Uses the Assistants/Threads/Runs APIs (server-side thread state)
 - chat: Uses the Chat Completions API (client-side transcript)
-- responses: Uses the Responses API (client-side transcript)
+- responses: Uses the Responses API (server-side state via previous_response_id)
 
-It constructs a single `OpenAI` client (reading `OPENAI_API_KEY` from your OS
+It constructs a single pooled `OpenAI` client (reading `OPENAI_API_KEY` from your OS
 environment) and routes control based on `--mode`. This file intentionally keeps
 policy/behavior minimal; see individual modules in `agentkit/` for details.
 
@@ -17,13 +17,14 @@ Quick start:
 """
 
 import argparse
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-from openai import OpenAI
-
-from agentkit.builder import AgentSpec, build_agent, create_session
-from agentkit.repl import run_repl
-from agentkit import chat_loop, responses_loop
+# agentkit (and with it the OpenAI SDK) is imported inside main(): the client
+# helpers after argument parsing, so `--help` and usage errors need neither,
+# and each mode implementation inside its own branch, so a run only loads the
+# agentkit modules for the mode it actually uses.
 
 
 def parse_args():
@@ -34,6 +35,8 @@ def parse_args():
     - --model <name>: Overrides the model used by the selected mode (Assistants uses AgentSpec.model).
     - --system <text>: Sets a system prompt/instructions for chat/responses modes.
     - --stream: Enables best-effort streaming for chat/responses modes (ignored in assistants mode).
+    - --server-state: In chat mode, keep conversation state server-side (only the new message is sent per turn).
+    - --async: Run the asyncio REPL variant on AsyncOpenAI (any mode; ignored with --server-state).
     """
     parser = argparse.ArgumentParser(description="Generic OpenAI Agents/Chat/Responses REPL")
 
@@ -60,9 +63,32 @@ def parse_args():
         "--system",
         help="Override system prompt/instructions for chat/responses modes",
     )
+
+    # Server-side state avoids resending the whole transcript every chat turn.
+    parser.add_argument(
+        "--server-state",
+        action="store_true",
+        help="Chat mode: chain turns via previous_response_id instead of resending the transcript",
+    )
+
+    # Asyncio REPL variant (AsyncOpenAI + non-blocking input).
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Use the asyncio REPL built on AsyncOpenAI",
+    )
     return parser.parse_args()
 
 
+def _run_async(coro) -> None:
+    """Run an async REPL coroutine to completion; Ctrl+C exits quietly."""
+    try:
+        asyncio.run(coro)
+    except KeyboardInterrupt:
+        print()
+
+
 def main() -> int:
     """High-level entrypoint for generic OpenAI experimentation modes.
 
@@ -72,6 +98,7 @@ def main() -> int:
     - responses: Responses API via agentkit.responses_mode.responses_loop
     """
     args = parse_args()
+    from agentkit.clients import build_async_client, build_client, warm_up
 
     # Read API key from environment (prefer global OS env). The OpenAI SDK
     # automatically reads `OPENAI_API_KEY` when constructing the client below.
@@ -80,36 +107,53 @@ def main() -> int:
     if not api_key:
         print("WARNING: OPENAI_API_KEY is not set. The app will not be able to call the API.")
 
-    # Construct a single client instance shared across modes. Creating the
-    # client does not perform a network call; API requests happen on method use.
-    client = OpenAI()
+    # Construct only the client the selected mode runs on. Creating a client
+    # does not perform a network call; API requests happen on method use. Its
+    # keep-alive (HTTP/2 when available) pool is reused for every turn, so the
+    # TLS handshake is paid once per session (see agentkit.clients). The async
+    # REPLs run on an AsyncOpenAI client; assistants mode still needs the sync
+    # client to set up the assistant and thread, and --server-state chat has
+    # no async variant.
+    use_async = args.use_async and not (args.mode == "chat" and args.server_state)
+    client = build_client() if args.mode == "assistants" or not use_async else None
 
     # Assistants mode: create (or reuse) an Assistant and a Thread, then run the
     # Assistants REPL. `--model` overrides the spec's model at runtime.
     if args.mode == "assistants":
+        from agentkit.builder import AgentSpec, build_agent, create_session
+        from agentkit.repl import run_repl, run_repl_async
+
         spec = AgentSpec()
         if args.model:
             spec.model = args.model  # Example to override instructions for Assistants:
                                      # spec.instructions = "You are ..."  # prefer using AgentSpec
         try:
-            assistant = build_agent(client, spec)
-            thread = create_session(client, assistant.id)
+            # The thread does not depend on the assistant: create both at once.
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                thread_future = pool.submit(create_session, client)
+                assistant = build_agent(client, spec)
+                thread = thread_future.result()
         except Exception as e:
             print("ERROR: Failed to create assistant/thread:", e)
             return 1
         # Use default intro/prompt from run_repl(); do not override by default.
         # To customize the intro, pass intro=... to run_repl().
-        run_repl(
-            client,
-            thread,
-            assistant_id=assistant.id,
-        )
+        if use_async:
+            _run_async(run_repl_async(build_async_client(), thread, assistant_id=assistant.id))
+        else:
+            run_repl(
+                client,
+                thread,
+                assistant_id=assistant.id,
+            )
         return 0
 
     # Chat Completions mode: maintain a local transcript and call the Chat API
     # each turn. `--system` seeds the transcript; `--stream` enables best-effort
     # token streaming when supported by the SDK/model.
     if args.mode == "chat":
+        if not use_async:
+            warm_up(client)  # connect while the user types the first message
         # Use defaults from chat_completions.chat_loop unless overrides are provided.
         # Example to override in code (prefer CLI flags):
         # chat_loop(client, model="gpt-4o-mini", system_prompt="You are helpful", intro="...", stream=True)
@@ -120,12 +164,25 @@ def main() -> int:
             kwargs["system_prompt"] = args.system
         if args.stream:
             kwargs["stream"] = True
-        chat_loop(client, **kwargs)
+        if args.server_state:
+            from agentkit.chat_completions import chat_loop_server_state
+
+            chat_loop_server_state(client, **kwargs)
+        elif use_async:
+            from agentkit.chat_completions import chat_loop_async
+
+            _run_async(chat_loop_async(build_async_client(), **kwargs))
+        else:
+            from agentkit.chat_completions import chat_loop
+
+            chat_loop(client, **kwargs)
         return 0
 
     # Responses API mode: similar console UX but uses the Responses endpoint
     # under the hood instead of Chat Completions.
     if args.mode == "responses":
+        if not use_async:
+            warm_up(client)  # connect while the user types the first message
         # Use defaults from responses_mode.responses_loop unless overrides are provided.
         # Example to override in code (prefer CLI flags):
         # responses_loop(client, model="gpt-4o-mini", system_prompt="You are helpful", intro="...", stream=True)
@@ -136,7 +193,14 @@ def main() -> int:
             kwargs["system_prompt"] = args.system
         if args.stream:
             kwargs["stream"] = True
-        responses_loop(client, **kwargs)
+        if use_async:
+            from agentkit.responses_mode import responses_loop_async
+
+            _run_async(responses_loop_async(build_async_client(), **kwargs))
+        else:
+            from agentkit.responses_mode import responses_loop
+
+            responses_loop(client, **kwargs)
         return 0
 
     # Defensive guard: argparse should restrict values, but keep a fallback.
@@ -1,45 +1,389 @@
 """
 A minimal smoke test that verifies local environment and imports.
 This script does NOT make any network/API calls.
+
+Usage
+- `python smoke_test.py`          quick checks: Python version, environment, and
+  that the OpenAI SDK and agentkit modules are present (located, not imported)
+- `python smoke_test.py --full`   also import the OpenAI SDK and the agentkit package,
+  and check that `agentkit.clients.build_client` applies its connection pool
+  (`--skip-openai` / `--skip-agents` drop the SDK / agentkit checks)
+- `--profile-imports`             also time each agentkit mode module's import in a
+  fresh interpreter (`-X importtime`) and fail if one exceeds the budget
+- `--json`                        print the results as a JSON list of
+  {"name", "ok", "detail"} objects instead of the text report (same exit code)
+
+A passing `--full` run is recorded in `~/.cache/agentkit/smoke.json` (or under
+`$XDG_CACHE_HOME`), keyed by the interpreter, the installed versions of the
+OpenAI SDK and the packages it requires, OPENAI_API_KEY presence, and the
+source of agentkit and of this script. The record is only
+used when opted in with `SMOKE_FAST=1`: then, for a day while that key
+matches, `--full` skips its import checks. `--no-cache` always runs them.
+
+Check output goes through `logging` at INFO, with warnings and errors at
+their own levels. Set SMOKE_LOG to a level name (e.g. WARNING) or
+SMOKE_QUIET=1 to silence the progress lines, e.g. in CI that only checks the
+exit code; the final result banner is always printed.
 """
+import importlib.util
+import io
+import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+
+_FLAGS = ("--full", "--skip-openai", "--skip-agents", "--profile-imports", "--no-cache", "--json")
+_AGENTKIT_MODULES = (
+    "agentkit.builder",
+    "agentkit.repl",
+    "agentkit.chat_completions",
+    "agentkit.responses_mode",
+    "agentkit.clients",
+)
+# Mode modules must stay cheap to import (the SDK is loaded lazily); a
+# cumulative import time above this budget usually means a new heavy
+# top-level import. agentkit.clients is excluded: it imports the SDK by design.
+_PROFILED_MODULES = tuple(m for m in _AGENTKIT_MODULES if m != "agentkit.clients")
+_IMPORT_BUDGET_MS = 250
+# Result of the last complete --full run that passed, under agentkit's cache
+# directory (see module docstring and agentkit/_cache.py)
+_CACHE_NAME = "smoke.json"
+_CACHE_TTL = 24 * 60 * 60  # seconds
+_AGENTKIT_DIR = Path(__file__).resolve().parent / "agentkit"
+
+
+@dataclass(slots=True)
+class CheckResult:
+    """Outcome of one check: its name, whether it passed, and its logged output."""
+    name: str
+    ok: bool
+    detail: str
+
+
+def _check_python(log: logging.Logger) -> int:
+    v = sys.version_info
+    log.info("Python: %d.%d.%d", v.major, v.minor, v.micro)
+    return 0
+
 
+@lru_cache(maxsize=1)
+def _has_api_key() -> bool:
+    """Whether OPENAI_API_KEY is set to a non-empty value, looked up once.
 
-def main() -> int:
-    print("[1/4] Checking Python version...")
-    print(f"Python: {sys.version.split()[0]}")
+    Only presence is needed, so the secret itself is never kept around.
+    """
+    return bool(os.environ.get("OPENAI_API_KEY"))
 
-    print("[2/4] Checking environment variables...")
-    api_key = os.getenv("OPENAI_API_KEY")
-    if api_key:
-        print("OPENAI_API_KEY: found (length hidden)")
+
+def _check_env(log: logging.Logger) -> int:
+    if _has_api_key():
+        log.info("OPENAI_API_KEY: found (length hidden)")
     else:
-        print("WARNING: OPENAI_API_KEY not set. The app will not be able to call the API.")
+        log.warning("WARNING: OPENAI_API_KEY not set. The app will not be able to call the API.")
+    return 0
+
+
+def _probe_openai(log: logging.Logger) -> int:
+    # find_spec locates the package without executing openai/__init__.py.
+    if importlib.util.find_spec("openai") is None:
+        log.error("ERROR: OpenAI SDK not installed (run `make setup`).")
+        return 1
+    log.info("OpenAI SDK available (not imported; use --full to construct a client).")
+    return 0
+
 
-    print("[3/4] Verifying OpenAI SDK import and basic client construction...")
+def _check_openai(log: logging.Logger) -> int:
+    # Imported here so the quick checks never pay for loading the SDK.
+    # Only the expected failures are caught; anything else is a bug and
+    # should crash with a full traceback.
     try:
-        from openai import OpenAI  # type: ignore
-        _client = OpenAI()  # uses env var if present; does not make a request
-        print("OpenAI client constructed successfully (no network call made).")
-    except Exception as e:
-        print("ERROR: Failed to import or construct OpenAI client:")
-        print(e)
+        import openai
+    except ImportError as e:
+        log.error("ERROR: Failed to import the OpenAI SDK:\n%s", e)
         return 1
+    try:
+        openai.OpenAI()  # uses env var if present; does not make a request
+    except openai.OpenAIError as e:  # e.g. no API key configured
+        log.error("ERROR: Failed to construct OpenAI client:\n%s", e)
+        return 1
+    log.info("OpenAI client constructed successfully (no network call made).")
+    return 0
+
+
+def _probe_agentkit(log: logging.Logger) -> int:
+    # Locates each mode module without executing it (agentkit/__init__ is lazy).
+    missing = [m for m in _AGENTKIT_MODULES if importlib.util.find_spec(m) is None]
+    if missing:
+        log.error("ERROR: agentkit modules not found: %s", ", ".join(missing))
+        return 1
+    log.info("agentkit modules found (not imported; use --full to import them).")
+    return 0
+
+
+def _check_agentkit(log: logging.Logger) -> int:
+    try:
+        # Resolving every re-export imports each submodule (and the SDK).
+        import agentkit
+        missing = [name for name in agentkit.__all__ if not hasattr(agentkit, name)]
+        if missing:
+            log.error("ERROR: agentkit.__all__ names that do not resolve: %s", ", ".join(missing))
+            return 1
+        log.info("agentkit package imported successfully.")
+    except ImportError as e:  # other errors are bugs: let them raise
+        log.error("ERROR: Failed to import local agentkit package:\n%s", e)
+        return 1
+    return 0
+
+
+def _check_pool(log: logging.Logger) -> int:
+    # build_client must hand the SDK our pool limits; if the SDK's HTTP client
+    # ignored them, idle connections would expire after its 5 s default.
+    try:
+        from agentkit.clients import POOL_LIMITS, build_client
+    except ImportError as e:
+        log.error("ERROR: Failed to import agentkit.clients:\n%s", e)
+        return 1
+    client = build_client(api_key="smoke-test")  # no request is made
+    pool = getattr(getattr(client._client, "_transport", None), "_pool", None)
+    expiry = getattr(pool, "_keepalive_expiry", None)
+    client.close()
+    if expiry != POOL_LIMITS.keepalive_expiry:
+        log.error(
+            "ERROR: build_client's connection pool has keepalive_expiry=%s, expected %s",
+            expiry,
+            POOL_LIMITS.keepalive_expiry,
+        )
+        return 1
+    log.info("build_client keeps idle connections for %g s.", expiry)
+    return 0
+
+
+def main(argv=None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    # Collect every line the checks log and emit it with a single write
+    # (also on failure or an unexpected exception).
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            return _run(args)
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
 
-    print("[4/4] Verifying local agentkit package imports...")
+def _cache_key() -> str:
+    """Fingerprint of everything the --full import checks depend on."""
+    import hashlib  # only needed on the --full path
+    import re
+    from importlib import metadata
+
+    def version(dist: str) -> str:
+        try:
+            return metadata.version(dist)
+        except metadata.PackageNotFoundError:
+            return "-"
+
+    h = hashlib.sha1(f"{sys.executable}|{sys.version}".encode("utf-8"))
+    # The SDK and the packages it requires (pydantic, jiter, anyio, its HTTP
+    # library, ...): upgrading any of them can break the imports.
+    h.update(f"openai=={version('openai')}".encode("utf-8"))
     try:
-        from agentkit.builder import AgentSpec, build_agent, create_session  # type: ignore
-        from agentkit.repl import run_repl  # type: ignore
-        from agentkit import chat_loop, responses_loop  # type: ignore
-        _ = (AgentSpec, build_agent, create_session, run_repl, chat_loop, responses_loop)
-        print("agentkit package imported successfully.")
-    except Exception as e:
-        print("ERROR: Failed to import local agentkit package:")
-        print(e)
+        requires = metadata.requires("openai") or []
+    except metadata.PackageNotFoundError:
+        requires = []
+    for req in sorted(requires):
+        if "extra ==" in req:
+            continue  # optional extras are not imported by the checks
+        dist = re.match(r"[A-Za-z0-9._-]+", req).group(0)
+        h.update(f"{dist}=={version(dist)}".encode("utf-8"))
+    # Key presence is included: client construction fails without it.
+    h.update(b"key" if _has_api_key() else b"nokey")
+    for path in [Path(__file__).resolve(), *sorted(_AGENTKIT_DIR.glob("*.py"))]:
+        h.update(path.name.encode("utf-8"))
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def _cache_hit() -> bool:
+    import time
+
+    from agentkit._cache import CACHE_DIR, read_json
+
+    data = read_json(CACHE_DIR / _CACHE_NAME)
+    return (
+        isinstance(data, dict)
+        and data.get("key") == _cache_key()
+        and time.time() - data.get("ts", 0) < _CACHE_TTL
+    )
+
+
+def _store_cache() -> None:
+    """Record a passing --full run; best-effort (an unwritable cache is ignored)."""
+    import time
+
+    from agentkit._cache import CACHE_DIR, write_json
+
+    write_json(CACHE_DIR / _CACHE_NAME, {"key": _cache_key(), "ts": time.time()})
+
+
+def _report_cached(log: logging.Logger) -> int:
+    log.info(
+        "cached OK (a --full run passed within the last day with this interpreter,\n"
+        "installed packages and source; unset SMOKE_FAST to re-run)."
+    )
+    return 0
+
+
+def _import_time_ms(module: str) -> float:
+    """Cumulative import time of `module` in a fresh interpreter, in ms.
+
+    Raises RuntimeError if the import fails or reports no timing.
+    """
+    import re
+    import subprocess
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    # Lines look like: "import time:   701 |   33593 | agentkit.builder"
+    for m in re.finditer(r"^import time:\s*\d+\s*\|\s*(\d+)\s*\| (\S+)$", proc.stderr, re.M):
+        if m.group(2) == module:
+            return int(m.group(1)) / 1000
+    raise RuntimeError(f"no import time reported for {module}")
+
+
+def _profile_imports(log: logging.Logger) -> int:
+    over = []
+    for module in _PROFILED_MODULES:
+        try:
+            ms = _import_time_ms(module)
+        except RuntimeError as e:
+            log.error("ERROR: could not profile %s: %s", module, e)
+            return 1
+        log.info("%s: %.1f ms", module, ms)
+        if ms > _IMPORT_BUDGET_MS:
+            over.append(module)
+    if over:
+        log.error("ERROR: import time over the %d ms budget: %s", _IMPORT_BUDGET_MS, ", ".join(over))
         return 1
+    return 0
 
-    print("\nSmoke test passed. Your environment looks good.")
+
+# (label, check) pairs, built once; `_run` picks which ones apply and numbers them.
+_STEP_PYTHON = ("Checking Python version...", _check_python)
+_STEP_ENV = ("Checking environment variables...", _check_env)
+_STEP_PROBE_OPENAI = ("Checking OpenAI SDK is installed...", _probe_openai)
+_STEP_OPENAI = ("Verifying OpenAI SDK import and basic client construction...", _check_openai)
+_STEP_PROBE_AGENTKIT = ("Checking local agentkit modules are present...", _probe_agentkit)
+_STEP_AGENTKIT = ("Verifying local agentkit package imports...", _check_agentkit)
+_STEP_POOL = ("Verifying the agentkit client connection pool...", _check_pool)
+_STEP_CACHED = ("Skipping OpenAI SDK and agentkit import checks...", _report_cached)
+_STEP_PROFILE = ("Profiling agentkit import times...", _profile_imports)
+
+
+def _log_level() -> int:
+    """Level for the check output (see module docstring).
+
+    SMOKE_QUIET=1 keeps only warnings and errors; otherwise SMOKE_LOG (a level
+    name, default INFO) applies, falling back to INFO if it is not one.
+    """
+    if os.environ.get("SMOKE_QUIET"):
+        return logging.WARNING
+    level = logging.getLevelName(os.environ.get("SMOKE_LOG", "INFO").upper())
+    return level if isinstance(level, int) else logging.INFO
+
+
+def _logger(stream, level: int) -> logging.Logger:
+    """A standalone logger writing bare messages to `stream`.
+
+    Not registered with the logging module, so concurrent checks each get
+    their own output and nothing propagates to the root logger. Messages use
+    lazy %-formatting: lines below `level` are never formatted.
+    """
+    log = logging.Logger("smoke", level)
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(handler)
+    return log
+
+
+def _capture(check, level: int) -> CheckResult:
+    """Run one check and collect its outcome (named after the check function)."""
+    buf = io.StringIO()
+    code = check(_logger(buf, level))
+    return CheckResult(check.__name__.lstrip("_"), code == 0, buf.getvalue().rstrip("\n"))
+
+
+def _run(args) -> int:
+    unknown = [a for a in args if a not in _FLAGS]
+    if unknown:
+        print(f"usage: smoke_test.py [{'] ['.join(_FLAGS)}]")
+        print("unrecognized arguments:", " ".join(unknown))
+        return 2
+    full = "--full" in args
+    cached = (
+        full
+        and os.environ.get("SMOKE_FAST") == "1"
+        and "--no-cache" not in args
+        and _cache_hit()
+    )
+
+    steps = [_STEP_PYTHON, _STEP_ENV]
+    if cached:
+        steps.append(_STEP_CACHED)
+    else:
+        if "--skip-openai" not in args:
+            steps.append(_STEP_OPENAI if full else _STEP_PROBE_OPENAI)
+        if "--skip-agents" not in args:
+            steps.append(_STEP_AGENTKIT if full else _STEP_PROBE_AGENTKIT)
+            if full:
+                steps.append(_STEP_POOL)
+    if "--profile-imports" in args:
+        steps.append(_STEP_PROFILE)
+
+    # The checks are independent, so they run concurrently (the SDK and
+    # agentkit imports overlap their file I/O) and are reported in order,
+    # stopping at the first failure (--json reports every result). Import
+    # profiling is not run alongside them: parallel work would skew its timings.
+    level = _log_level()
+    log = _logger(sys.stdout, level)
+    parallel = [step for step in steps if step is not _STEP_PROFILE]
+    with ThreadPoolExecutor(max_workers=len(parallel)) as pool:
+        futures = [pool.submit(_capture, check, level) for _, check in parallel]
+        results = [f.result() for f in futures]
+    if len(parallel) < len(steps):
+        results.append(_capture(_STEP_PROFILE[1], level))
+    if "--json" in args:
+        import json
+
+        print(json.dumps([asdict(r) for r in results], indent=2))
+    else:
+        for i, ((label, _), result) in enumerate(zip(steps, results), 1):
+            log.info("[%d/%d] %s", i, len(steps), label)
+            if result.detail:
+                sys.stdout.write(result.detail + "\n")
+            if not result.ok:
+                return 1
+    if not all(r.ok for r in results):
+        return 1
+
+    if full and not cached and not {"--skip-openai", "--skip-agents"} & set(args):
+        _store_cache()
+    if "--json" in args:
+        return 0
+    if full:
+        print("\nSmoke test passed. Your environment looks good.")
+    else:
+        print("\nQuick checks passed. Run with --full to also import the OpenAI SDK and agentkit.")
     print("Next: `python app.py --mode assistants|chat|responses` to run a REPL.")
     return 0
 